@@ -17,8 +17,13 @@ DATABASE_URL = os.environ.get("DATABASE_URL", "dbname=smol")
 
 IS_SQLITE = DATABASE_URL.startswith("sqlite:")
 
-# Track whether tags column exists (checked on first query)
-_tags_column_exists: bool | None = None
+# PostgreSQL connection pool, created on first use so importing the module
+# (e.g. under the SQLite backend or in tests) never opens a connection.
+_pg_pool = None
+
+# Column names of the graphs table (read on first query), so optional columns
+# such as tags and edges_json are only selected when the database has them.
+_graph_columns: set[str] | None = None
 
 
 def _get_sqlite_path() -> str:
@@ -26,6 +31,40 @@ def _get_sqlite_path() -> str:
     return DATABASE_URL.replace("sqlite:///", "").replace("sqlite:", "")
 
 
+def _get_pg_pool():
+    """Return the shared PostgreSQL connection pool, creating it on first use."""
+    global _pg_pool
+    if _pg_pool is None:
+        from psycopg2.pool import ThreadedConnectionPool
+        _pg_pool = ThreadedConnectionPool(
+            2, max(8, os.cpu_count() or 1), DATABASE_URL,
+            # Let the OS notice dead idle connections (server restart, reaping).
+            keepalives=1, keepalives_idle=30, keepalives_interval=10, keepalives_count=3,
+        )
+    return _pg_pool
+
+
+def _checkout_pg(pool):
+    """Check an open connection out of the pool, or return None if it is exhausted.
+
+    Connections already known to be closed are dropped from the pool. There is
+    no per-checkout ping (that would cost a round trip per request): dead peers
+    are detected by TCP keepalives, and a connection that fails mid-request is
+    discarded by get_db instead of being returned to the pool.
+    """
+    from psycopg2.pool import PoolError
+
+    for _ in range(pool.maxconn + 1):
+        try:
+            conn = pool.getconn()
+        except PoolError:
+            return None
+        if not conn.closed:
+            return conn
+        pool.putconn(conn, close=True)
+    return None
+
+
 @asynccontextmanager
 async def get_db():
     """Get database connection (async for SQLite, sync wrapped for PG)."""
@@ -39,32 +78,70 @@ async def get_db():
             await conn.close()
     else:
         import psycopg2
-        conn = psycopg2.connect(DATABASE_URL)
+        pool = _get_pg_pool()
+        conn = _checkout_pg(pool)
+        pooled = conn is not None
+        if not pooled:
+            # Every pooled connection is checked out: use a one-off connection.
+            conn = psycopg2.connect(DATABASE_URL)
+        broken = False
         try:
             yield conn
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            # The connection died under this request: don't hand it out again.
+            broken = True
+            raise
         finally:
-            conn.close()
+            if pooled:
+                # putconn rolls back any open transaction before reuse
+                pool.putconn(conn, close=broken)
+            else:
+                conn.close()
 
 
-async def _check_tags_column() -> bool:
-    """Check if tags column exists in the graphs table."""
-    global _tags_column_exists
-    if _tags_column_exists is not None:
-        return _tags_column_exists
+@asynccontextmanager
+async def _connection(db=None):
+    """Use the caller's connection if given, else open one for this call.
+
+    Handlers that make several queries per request (e.g. /graph, /compare)
+    open one connection with get_db() and pass it down, instead of paying a
+    connect/close per fetch.
+    """
+    if db is not None:
+        yield db
+    else:
+        async with get_db() as conn:
+            yield conn
+
+
+async def _get_graph_columns() -> set[str]:
+    """Return the column names of the graphs table."""
+    global _graph_columns
+    if _graph_columns is not None:
+        return _graph_columns
 
     async with get_db() as conn:
         if IS_SQLITE:
             cursor = await conn.execute("PRAGMA table_info(graphs)")
-            columns = [row[1] for row in await cursor.fetchall()]
-            _tags_column_exists = "tags" in columns
+            _graph_columns = {row[1] for row in await cursor.fetchall()}
         else:
             cur = conn.cursor()
             cur.execute("""
                 SELECT column_name FROM information_schema.columns
-                WHERE table_name = 'graphs' AND column_name = 'tags'
+                WHERE table_name = 'graphs'
             """)
-            _tags_column_exists = cur.fetchone() is not None
-    return _tags_column_exists
+            _graph_columns = {row[0] for row in cur.fetchall()}
+    return _graph_columns
+
+
+async def _check_tags_column() -> bool:
+    """Check if tags column exists in the graphs table."""
+    return "tags" in await _get_graph_columns()
+
+
+async def _check_edges_json_column() -> bool:
+    """Check if the precomputed edges_json column exists in the graphs table."""
+    return "edges_json" in await _get_graph_columns()
 
 
 def _placeholder() -> str:
@@ -80,8 +157,8 @@ def _parse_row(row: Any) -> dict[str, Any] | None:
     if IS_SQLITE:
         d = dict(row)
         # Eigenvalue arrays are no longer stored (computed on demand from graph6
-        # for the viz); only tags remains as a JSON-encoded column in SQLite.
-        json_fields = ["tags"]
+        # for the viz); tags and edges_json are the JSON-encoded columns in SQLite.
+        json_fields = ["tags", "edges_json"]
         for field in json_fields:
             if field in d and d[field] is not None:
                 d[field] = json.loads(d[field])
@@ -109,13 +186,18 @@ def _tags_col(has_tags: bool) -> str:
     return ", tags" if has_tags else ""
 
 
-async def fetch_graph(graph6: str) -> dict[str, Any] | None:
+def _edges_col(has_edges: bool) -> str:
+    """Return edges_json column selection if it exists."""
+    return ", edges_json" if has_edges else ""
+
+
+async def fetch_graph(graph6: str, db=None) -> dict[str, Any] | None:
     """Fetch a single graph by graph6 string."""
     ph = _placeholder()
     has_tags = await _check_tags_column()
-    tags_col = _tags_col(has_tags)
+    optional_cols = _tags_col(has_tags) + _edges_col(await _check_edges_json_column())
 
-    async with get_db() as conn:
+    async with _connection(db) as conn:
         if IS_SQLITE:
             cursor = await conn.execute(
                 f"""
@@ -142,7 +224,7 @@ async def fetch_graph(graph6: str) -> dict[str, Any] | None:
                        yoon3_spectral_hash,
                        non3cyc_spectral_hash,
                        non4cyc_spectral_hash
-                       {tags_col}
+                       {optional_cols}
                 FROM graphs
                 WHERE graph6 = {ph}
                 """,
@@ -178,7 +260,7 @@ async def fetch_graph(graph6: str) -> dict[str, Any] | None:
                        yoon3_spectral_hash,
                        non3cyc_spectral_hash,
                        non4cyc_spectral_hash
-                       {tags_col}
+                       {optional_cols}
                 FROM graphs
                 WHERE graph6 = {ph}
                 """,
@@ -188,36 +270,43 @@ async def fetch_graph(graph6: str) -> dict[str, Any] | None:
 
 
 async def fetch_cospectral_mates(
-    graph6: str, n: int, hashes: dict[str, str]
+    graph6: str, n: int, hashes: dict[str, str], db=None
 ) -> dict[str, list[str]]:
     """Fetch cospectral mates for each matrix type.
 
     Mates are derived directly from the per-matrix spectral_hash columns (using the
     idx_n_<matrix>_hash indexes): any other graph with the same n and hash is a mate.
-    This replaces the old pre-computed pairs table.
+    All matrix types are fetched in one round trip, as a UNION ALL with one indexed
+    arm per matrix, and bucketed by matrix type here.
     """
     ph = _placeholder()
     # Always initialize with all matrix types (for Pydantic model compatibility)
     mates = {k: [] for k in MATRIX_KEYS}
 
-    async with get_db() as conn:
-        for matrix, h in hashes.items():
-            if not h or matrix not in MATRIX_KEYS:
-                continue
-            hash_col = f"{matrix}_spectral_hash"
-            sql = (
-                f"SELECT graph6 FROM graphs "
-                f"WHERE n = {ph} AND {hash_col} = {ph} AND graph6 <> {ph} "
-                f"ORDER BY graph6"
-            )
-            if IS_SQLITE:
-                cursor = await conn.execute(sql, (n, h, graph6))
-                rows = await cursor.fetchall()
-            else:
-                cur = conn.cursor()
-                cur.execute(sql, (n, h, graph6))
-                rows = cur.fetchall()
-            mates[matrix] = [r[0] for r in rows]
+    arms = []
+    params: list[Any] = []
+    for matrix, h in hashes.items():
+        if not h or matrix not in MATRIX_KEYS:
+            continue
+        arms.append(
+            f"SELECT {ph} AS matrix_type, graph6 FROM graphs "
+            f"WHERE n = {ph} AND {matrix}_spectral_hash = {ph} AND graph6 <> {ph}"
+        )
+        params.extend([matrix, n, h, graph6])
+    if not arms:
+        return mates
+    sql = " UNION ALL ".join(arms) + " ORDER BY graph6"
+
+    async with _connection(db) as conn:
+        if IS_SQLITE:
+            cursor = await conn.execute(sql, params)
+            rows = await cursor.fetchall()
+        else:
+            cur = conn.cursor()
+            cur.execute(sql, params)
+            rows = cur.fetchall()
+    for matrix, mate in rows:
+        mates[matrix].append(mate)
     return mates
 
 
@@ -499,7 +588,7 @@ async def fetch_random_graph() -> dict[str, Any] | None:
     import random
     ph = _placeholder()
     has_tags = await _check_tags_column()
-    tags_col = _tags_col(has_tags)
+    optional_cols = _tags_col(has_tags) + _edges_col(await _check_edges_json_column())
 
     # Uniformly sample n from [4, 9]
     rand_n = random.randint(4, 9)
@@ -544,7 +633,7 @@ async def fetch_random_graph() -> dict[str, Any] | None:
                        yoon3_spectral_hash,
                        non3cyc_spectral_hash,
                        non4cyc_spectral_hash
-                       {tags_col}
+                       {optional_cols}
                 FROM graphs
                 WHERE n = {ph}
                 LIMIT 1 OFFSET {ph}
@@ -597,7 +686,7 @@ async def fetch_random_graph() -> dict[str, Any] | None:
                        yoon3_spectral_hash,
                        non3cyc_spectral_hash,
                        non4cyc_spectral_hash
-                       {tags_col}
+                       {optional_cols}
                 FROM graphs
                 WHERE n = {ph}
                 LIMIT 1 OFFSET {ph}
@@ -822,12 +911,12 @@ async def get_stats() -> dict[str, Any]:
 
 
 async def fetch_graph_mechanisms(
-    graph6: str, matrix_type: str | None = None
+    graph6: str, matrix_type: str | None = None, db=None
 ) -> dict[str, Any]:
     """Fetch all mechanisms for a specific graph."""
     ph = _placeholder()
 
-    async with get_db() as conn:
+    async with _connection(db) as conn:
         if IS_SQLITE:
             # Get graph info
             cursor = await conn.execute(
@@ -931,12 +1020,12 @@ async def fetch_graph_mechanisms(
 
 
 async def fetch_pairwise_mechanisms(
-    graph6_1: str, graph6_2: str
+    graph6_1: str, graph6_2: str, db=None
 ) -> dict[str, Any]:
     """Fetch mechanisms between two specific graphs (bidirectional)."""
     ph = _placeholder()
 
-    async with get_db() as conn:
+    async with _connection(db) as conn:
         if IS_SQLITE:
             # Get both graph IDs
             cursor = await conn.execute(
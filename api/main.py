@@ -4,20 +4,24 @@ import csv
 import io
 import logging
 import time
+from functools import lru_cache
 from pathlib import Path
 
-import networkx as nx
+import numpy as np
 from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from pydantic import TypeAdapter
 
 from .database import (
     fetch_cospectral_mates,
     fetch_graph,
     fetch_graph_mechanisms,
+    fetch_pairwise_mechanisms,
     fetch_random_cospectral_class,
     fetch_random_graph,
+    get_db,
     get_stats,
     query_graphs,
 )
@@ -32,7 +36,12 @@ from .models import (
 )
 from .routes import mechanisms
 from db.matrix_types import MATRIX_KEYS, real_keys, signature_keys
-from db.graph_data import eigenvalues_for_viz
+from db.graph_data import edges_from_graph6, eigenvalues_for_viz
+from db.spectral_distance import (
+    pairwise_wasserstein_sorted,
+    wasserstein_points,
+    wasserstein_sorted,
+)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -91,6 +100,18 @@ async def http_exception_handler(request: Request, exc: HTTPException):
     )
 
 
+# JSON bodies are serialized by Pydantic's Rust core straight to bytes, rather
+# than returning models and letting FastAPI walk them with jsonable_encoder
+# before the stdlib json.dumps.
+GRAPH_FULL_LIST = TypeAdapter(list[GraphFull])
+GRAPH_SUMMARY_LIST = TypeAdapter(list[GraphSummary])
+
+
+def json_response(body: bytes | str, headers: dict[str, str] | None = None) -> Response:
+    """Wrap an already-serialized JSON body in a response."""
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 def wants_html(request: Request) -> bool:
     """Check if request wants HTML (browser or HTMX) vs JSON (API)."""
     if request.headers.get("hx-request"):
@@ -99,39 +120,77 @@ def wants_html(request: Request) -> bool:
     return "text/html" in accept and "application/json" not in accept
 
 
+# The edge list is a pure function of graph6, so it is memoized. The response
+# models themselves are built per request: tags and properties are backfilled
+# in place (compute_tags.py, compute_properties.py), so a model cached by
+# graph6 would go stale, and callers would share one mutable instance.
+EDGE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=EDGE_CACHE_SIZE)
+def graph6_edges(graph6: str) -> tuple[tuple[int, int], ...]:
+    """Edge list (u < v) of a graph6 string, for visualization.
+
+    Fallback for rows whose precomputed edges_json is missing (databases that
+    predate sql/add_edges_json.sql or have not been backfilled yet).
+    """
+    return tuple(edges_from_graph6(graph6))
+
+
+def hashes_from_row(row: dict) -> dict[str, str]:
+    """Per-matrix spectral hashes of a graphs row, keyed by MATRIX_KEYS ("" if NULL)."""
+    return {k: row[f"{k}_spectral_hash"] or "" for k in MATRIX_KEYS}
+
+
+# Eigenvalue arrays are recomputed from graph6 (they are not stored), and the
+# compare page requests each graph's arrays twice: once for its plots and once
+# for /api/compare/distances. Entries for dense n=10 graphs run to hundreds of
+# KB (non-cycling spectra), hence the smaller bound. Callers must not mutate
+# the returned dict.
+EIGENVALUE_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=EIGENVALUE_CACHE_SIZE)
+def viz_eigenvalues(graph6: str) -> dict:
+    """eigenvalues_for_viz, memoized by graph6."""
+    return eigenvalues_for_viz(graph6)
+
+
+# GraphProperties fields are read from a graphs row by name. The distributions
+# are not selected by the graph queries, so only they may be absent (-> None);
+# every other column must be in the row, and a missing one raises KeyError.
+LAZY_PROPERTY_FIELDS = (
+    "degree_sequence",
+    "betweenness_centrality",
+    "closeness_centrality",
+    "eigenvector_centrality",
+)
+PROPERTY_FIELDS = tuple(f for f in GraphProperties.model_fields if f not in LAZY_PROPERTY_FIELDS)
+
+
+def _properties_from_row(row: dict) -> GraphProperties:
+    """GraphProperties from a graphs row, shared by the full and summary views."""
+    return GraphProperties.model_construct(
+        **{f: row[f] for f in PROPERTY_FIELDS},
+        **{f: row.get(f) for f in LAZY_PROPERTY_FIELDS},
+    )
+
+
+# Rows come from our own database with a known schema, so the response models
+# are built with model_construct, skipping Pydantic's per-field validation.
 def row_to_graph_full(row: dict, mates: dict[str, list[str]]) -> GraphFull:
-    G = nx.from_graph6_bytes(row["graph6"].encode())
-    edges = [tuple(sorted(e)) for e in G.edges()]
-    return GraphFull(
+    edges = row.get("edges_json")
+    if edges is None:
+        edges = graph6_edges(row["graph6"])
+    return GraphFull.model_construct(
         graph6=row["graph6"],
         n=row["n"],
         m=row["m"],
-        edges=edges,
-        properties=GraphProperties(
-            is_bipartite=row["is_bipartite"],
-            is_planar=row["is_planar"],
-            is_regular=row["is_regular"],
-            diameter=row["diameter"],
-            girth=row["girth"],
-            radius=row["radius"],
-            min_degree=row["min_degree"],
-            max_degree=row["max_degree"],
-            triangle_count=row["triangle_count"],
-            clique_number=row.get("clique_number"),
-            chromatic_number=row.get("chromatic_number"),
-            algebraic_connectivity=row.get("algebraic_connectivity"),
-            global_clustering=row.get("global_clustering"),
-            avg_local_clustering=row.get("avg_local_clustering"),
-            avg_path_length=row.get("avg_path_length"),
-            assortativity=row.get("assortativity"),
-            degree_sequence=row.get("degree_sequence"),
-            betweenness_centrality=row.get("betweenness_centrality"),
-            closeness_centrality=row.get("closeness_centrality"),
-            eigenvector_centrality=row.get("eigenvector_centrality"),
-        ),
+        edges=[tuple(e) for e in edges],
+        properties=_properties_from_row(row),
         # Eigenvalue arrays are loaded lazily by the frontend from
         # /api/graph/{g6}/eigenvalues; only the hashes are rendered inline.
-        spectra=Spectra(
+        spectra=Spectra.model_construct(
             adj_hash=row["adj_spectral_hash"],
             kirchhoff_hash=row["kirchhoff_spectral_hash"] or "",
             signless_hash=row["signless_spectral_hash"] or "",
@@ -149,38 +208,17 @@ def row_to_graph_full(row: dict, mates: dict[str, list[str]]) -> GraphFull:
             non3cyc_hash=row["non3cyc_spectral_hash"],
             non4cyc_hash=row["non4cyc_spectral_hash"],
         ),
-        cospectral_mates=CospectralMates(**mates),
+        cospectral_mates=CospectralMates.model_construct(**mates),
         tags=row.get("tags") or [],
     )
 
 
 def row_to_graph_summary(row: dict) -> GraphSummary:
-    return GraphSummary(
+    return GraphSummary.model_construct(
         graph6=row["graph6"],
         n=row["n"],
         m=row["m"],
-        properties=GraphProperties(
-            is_bipartite=row["is_bipartite"],
-            is_planar=row["is_planar"],
-            is_regular=row["is_regular"],
-            diameter=row["diameter"],
-            girth=row["girth"],
-            radius=row["radius"],
-            min_degree=row["min_degree"],
-            max_degree=row["max_degree"],
-            triangle_count=row["triangle_count"],
-            clique_number=row.get("clique_number"),
-            chromatic_number=row.get("chromatic_number"),
-            algebraic_connectivity=row.get("algebraic_connectivity"),
-            global_clustering=row.get("global_clustering"),
-            avg_local_clustering=row.get("avg_local_clustering"),
-            avg_path_length=row.get("avg_path_length"),
-            assortativity=row.get("assortativity"),
-            degree_sequence=row.get("degree_sequence"),
-            betweenness_centrality=row.get("betweenness_centrality"),
-            closeness_centrality=row.get("closeness_centrality"),
-            eigenvector_centrality=row.get("eigenvector_centrality"),
-        ),
+        properties=_properties_from_row(row),
         tags=row.get("tags", []) or [],
     )
 
@@ -196,38 +234,22 @@ async def get_graph_by_id(graph6: str, request: Request):
     """Look up a graph by its graph6 string."""
     t0 = time.perf_counter()
 
-    row = await fetch_graph(graph6)
-    t1 = time.perf_counter()
-    logger.info(f"  fetch_graph: {(t1-t0)*1000:.0f}ms")
+    async with get_db() as conn:
+        row = await fetch_graph(graph6, db=conn)
+        t1 = time.perf_counter()
+        logger.info(f"  fetch_graph: {(t1-t0)*1000:.0f}ms")
 
-    if not row:
-        raise HTTPException(status_code=404, detail=f"Graph '{graph6}' not found")
-
-    hashes = {
-        "adj": row["adj_spectral_hash"],
-        "kirchhoff": row["kirchhoff_spectral_hash"] or "",
-        "signless": row["signless_spectral_hash"] or "",
-        "lap": row["lap_spectral_hash"],
-        "nb": row["nb_spectral_hash"],
-        "nbl": row["nbl_spectral_hash"],
-        "dist": row["dist_spectral_hash"] or "",
-        "distlap": row["distlap_spectral_hash"] or "",
-        "distsign": row["distsign_spectral_hash"] or "",
-        "distnorm": row["distnorm_spectral_hash"] or "",
-        "ecc": row["ecc_spectral_hash"] or "",
-        "kblock_family": row["kblock_family_spectral_hash"] or "",
-        "yoon2": row["yoon2_spectral_hash"] or "",
-        "yoon3": row["yoon3_spectral_hash"] or "",
-        "non3cyc": row["non3cyc_spectral_hash"] or "",
-        "non4cyc": row["non4cyc_spectral_hash"] or "",
-    }
-    mates = await fetch_cospectral_mates(graph6, row["n"], hashes)
-    t2 = time.perf_counter()
-    logger.info(f"  fetch_cospectral_mates: {(t2-t1)*1000:.0f}ms")
+        if not row:
+            raise HTTPException(status_code=404, detail=f"Graph '{graph6}' not found")
+
+        hashes = hashes_from_row(row)
+        mates = await fetch_cospectral_mates(graph6, row["n"], hashes, db=conn)
+        t2 = time.perf_counter()
+        logger.info(f"  fetch_cospectral_mates: {(t2-t1)*1000:.0f}ms")
 
-    mechanisms_data = await fetch_graph_mechanisms(graph6)
-    t2_5 = time.perf_counter()
-    logger.info(f"  fetch_graph_mechanisms: {(t2_5-t2)*1000:.0f}ms")
+        mechanisms_data = await fetch_graph_mechanisms(graph6, db=conn)
+        t2_5 = time.perf_counter()
+        logger.info(f"  fetch_graph_mechanisms: {(t2_5-t2)*1000:.0f}ms")
 
     graph = row_to_graph_full(row, mates)
     t3 = time.perf_counter()
@@ -240,7 +262,7 @@ async def get_graph_by_id(graph6: str, request: Request):
         t4 = time.perf_counter()
         logger.info(f"  template render: {(t4-t3)*1000:.0f}ms")
         return resp
-    return graph
+    return json_response(graph.model_dump_json())
 
 
 @app.get("/random")
@@ -386,31 +408,14 @@ async def search_graphs(
                     request, "graph_list.html", {"graphs": []}
                 )
             return []
-        hashes = {
-            "adj": row["adj_spectral_hash"],
-            "kirchhoff": row["kirchhoff_spectral_hash"] or "",
-            "signless": row["signless_spectral_hash"] or "",
-            "lap": row["lap_spectral_hash"],
-            "nb": row["nb_spectral_hash"],
-            "nbl": row["nbl_spectral_hash"],
-            "dist": row["dist_spectral_hash"] or "",
-            "distlap": row["distlap_spectral_hash"] or "",
-            "distsign": row["distsign_spectral_hash"] or "",
-            "distnorm": row["distnorm_spectral_hash"] or "",
-            "ecc": row["ecc_spectral_hash"] or "",
-            "kblock_family": row["kblock_family_spectral_hash"] or "",
-            "yoon2": row["yoon2_spectral_hash"] or "",
-            "yoon3": row["yoon3_spectral_hash"] or "",
-            "non3cyc": row["non3cyc_spectral_hash"] or "",
-            "non4cyc": row["non4cyc_spectral_hash"] or "",
-        }
+        hashes = hashes_from_row(row)
         mates = await fetch_cospectral_mates(graph6, row["n"], hashes)
         graph = row_to_graph_full(row, mates)
         if wants_html(request):
             return templates.TemplateResponse(
                 request, "graph_detail.html", {"graph": graph}
             )
-        return [graph]
+        return json_response(GRAPH_FULL_LIST.dump_json([graph]))
 
     # Cap count check at 10k for API performance
     # API consumers can paginate through results or use export
@@ -449,7 +454,6 @@ async def search_graphs(
         offset=offset,
         max_count=MAX_COUNT,
     )
-    graphs = [row_to_graph_summary(row) for row in rows]
 
     if wants_html(request):
         # Build query params dict for the template
@@ -461,7 +465,7 @@ async def search_graphs(
         has_next = page < total_pages if total_count <= MAX_COUNT else False
 
         # Convert GraphSummary objects to dicts for JSON serialization in template
-        graphs_dicts = [g.model_dump() for g in graphs]
+        graphs_dicts = [row_to_graph_summary(row).model_dump() for row in rows]
 
         return templates.TemplateResponse(
             request, "search_results.html", {
@@ -480,7 +484,7 @@ async def search_graphs(
                 "sort_order": sort_order,
             }
         )
-    return graphs
+    return json_response(GRAPH_SUMMARY_LIST.dump_json([row_to_graph_summary(row) for row in rows]))
 
 
 @app.get("/search/count")
@@ -592,13 +596,13 @@ async def export_search_results(
         sort_by=sort_by,
         sort_order=sort_order,
     )
-    graphs = [row_to_graph_summary(row) for row in rows]
 
     # Export based on format
     format_lower = format.lower()
 
     if format_lower == "csv":
         # CSV export
+        graphs = [row_to_graph_summary(row) for row in rows]
         output = io.StringIO()
         if graphs:
             # Get all keys from first graph
@@ -647,7 +651,7 @@ async def export_search_results(
 
     elif format_lower == "graph6":
         # graph6 list export (one per line)
-        lines = [graph.graph6 for graph in graphs]
+        lines = [row["graph6"] for row in rows]
         content = "\n".join(lines)
         if content:
             content += "\n"
@@ -660,13 +664,45 @@ async def export_search_results(
 
     else:
         # JSON export (default)
-        data = [graph.model_dump() for graph in graphs]
-        return JSONResponse(
-            content=data,
+        return json_response(
+            GRAPH_SUMMARY_LIST.dump_json([row_to_graph_summary(row) for row in rows]),
             headers={"Content-Disposition": "attachment; filename=graphs.json"},
         )
 
 
+# GraphProperties fields the compare page highlights when they differ.
+COMPARED_PROPERTIES = (
+    "is_bipartite",
+    "is_planar",
+    "is_regular",
+    "diameter",
+    "girth",
+    "triangle_count",
+    "clique_number",
+    "chromatic_number",
+    "algebraic_connectivity",
+    "global_clustering",
+    "avg_local_clustering",
+    "avg_path_length",
+    "assortativity",
+)
+
+# Tags implied by the structural booleans, unioned with the stored tags (rows
+# tagged by an older compute_tags run may lack some of them).
+PROPERTY_TAGS = (
+    ("bipartite", "is_bipartite"),
+    ("planar", "is_planar"),
+    ("regular", "is_regular"),
+)
+
+
+def comparison_tags(graph: GraphFull) -> frozenset[str]:
+    """The tag set /compare diffs: the stored tags plus the property tags."""
+    return frozenset(graph.tags or ()).union(
+        tag for tag, prop in PROPERTY_TAGS if getattr(graph.properties, prop)
+    )
+
+
 @app.get("/compare")
 async def compare_graphs(
     request: Request,
@@ -684,34 +720,27 @@ async def compare_graphs(
     full_graphs = []
     all_hashes = {k: set() for k in MATRIX_KEYS}
 
-    for g6 in graph6_list:
-        row = await fetch_graph(g6)
-        if not row:
-            raise HTTPException(status_code=404, detail=f"Graph '{g6}' not found")
-
-        hashes = {
-            "adj": row["adj_spectral_hash"],
-            "kirchhoff": row["kirchhoff_spectral_hash"] or "",
-            "signless": row["signless_spectral_hash"] or "",
-            "lap": row["lap_spectral_hash"],
-            "nb": row["nb_spectral_hash"],
-            "nbl": row["nbl_spectral_hash"],
-            "dist": row["dist_spectral_hash"] or "",
-            "distlap": row["distlap_spectral_hash"] or "",
-            "distsign": row["distsign_spectral_hash"] or "",
-            "distnorm": row["distnorm_spectral_hash"] or "",
-            "ecc": row["ecc_spectral_hash"] or "",
-            "kblock_family": row["kblock_family_spectral_hash"] or "",
-            "yoon2": row["yoon2_spectral_hash"] or "",
-            "yoon3": row["yoon3_spectral_hash"] or "",
-            "non3cyc": row["non3cyc_spectral_hash"] or "",
-            "non4cyc": row["non4cyc_spectral_hash"] or "",
-        }
-        for matrix, h in hashes.items():
-            all_hashes[matrix].add(h)
+    # One connection for every query of the comparison, rather than a
+    # connect/close per fetch.
+    async with get_db() as conn:
+        for g6 in graph6_list:
+            row = await fetch_graph(g6, db=conn)
+            if not row:
+                raise HTTPException(status_code=404, detail=f"Graph '{g6}' not found")
 
-        mates = await fetch_cospectral_mates(g6, row["n"], hashes)
-        full_graphs.append(row_to_graph_full(row, mates))
+            hashes = hashes_from_row(row)
+            for matrix, h in hashes.items():
+                all_hashes[matrix].add(h)
+
+            mates = await fetch_cospectral_mates(g6, row["n"], hashes, db=conn)
+            full_graphs.append(row_to_graph_full(row, mates))
+
+        # Fetch mechanisms only for 2-graph comparisons (that's all we display)
+        mechanisms_by_pair = {}
+        if len(graph6_list) == 2:
+            mechs = await fetch_pairwise_mechanisms(graph6_list[0], graph6_list[1], db=conn)
+            if mechs:
+                mechanisms_by_pair["0_1"] = mechs
 
     logger.info(f"  compare fetch {len(graph6_list)} graphs: {(time.perf_counter()-t0)*1000:.0f}ms")
 
@@ -725,51 +754,25 @@ async def compare_graphs(
     }
     distance_matrix_data = None
 
-    # Fetch mechanisms only for 2-graph comparisons (that's all we display)
-    mechanisms_by_pair = {}
-    if len(graph6_list) == 2:
-        from api.database import fetch_pairwise_mechanisms
-        mechs = await fetch_pairwise_mechanisms(graph6_list[0], graph6_list[1])
-        if mechs:
-            mechanisms_by_pair["0_1"] = mechs
-
-    result = CompareResult(graphs=full_graphs, spectral_comparison=comparison, distance_matrix=distance_matrix_data)
+    result = CompareResult.model_construct(graphs=full_graphs, spectral_comparison=comparison, distance_matrix=distance_matrix_data)
 
     if wants_html(request):
-        # Compare tags (combine explicit tags + boolean properties)
-        all_tag_sets = []
-        for g in full_graphs:
-            tags = set(g.tags or [])
-            if g.properties.is_bipartite:
-                tags.add("bipartite")
-            if g.properties.is_planar:
-                tags.add("planar")
-            if g.properties.is_regular:
-                tags.add("regular")
-            all_tag_sets.append(frozenset(tags))
-
-        prop_diffs = {
-            "n": len(set(g.n for g in full_graphs)) > 1,
-            "m": len(set(g.m for g in full_graphs)) > 1,
-            "tags": len(set(all_tag_sets)) > 1,
-            "is_bipartite": len(set(g.properties.is_bipartite for g in full_graphs)) > 1,
-            "is_planar": len(set(g.properties.is_planar for g in full_graphs)) > 1,
-            "is_regular": len(set(g.properties.is_regular for g in full_graphs)) > 1,
-            "diameter": len(set(g.properties.diameter for g in full_graphs)) > 1,
-            "girth": len(set(g.properties.girth for g in full_graphs)) > 1,
-            "triangle_count": len(set(g.properties.triangle_count for g in full_graphs)) > 1,
-            "clique_number": len(set(g.properties.clique_number for g in full_graphs)) > 1,
-            "chromatic_number": len(set(g.properties.chromatic_number for g in full_graphs)) > 1,
-            "algebraic_connectivity": len(set(g.properties.algebraic_connectivity for g in full_graphs)) > 1,
-            "global_clustering": len(set(g.properties.global_clustering for g in full_graphs)) > 1,
-            "avg_local_clustering": len(set(g.properties.avg_local_clustering for g in full_graphs)) > 1,
-            "avg_path_length": len(set(g.properties.avg_path_length for g in full_graphs)) > 1,
-            "assortativity": len(set(g.properties.assortativity for g in full_graphs)) > 1,
-        }
+        all_tag_sets = [comparison_tags(g) for g in full_graphs]
+
+        # One pass over the graphs, comparing each to the first.
+        first, first_tags = full_graphs[0], all_tag_sets[0]
+        prop_diffs = dict.fromkeys(("n", "m", "tags", *COMPARED_PROPERTIES), False)
+        for g, tag_set in zip(full_graphs[1:], all_tag_sets[1:]):
+            prop_diffs["n"] |= g.n != first.n
+            prop_diffs["m"] |= g.m != first.m
+            prop_diffs["tags"] |= tag_set != first_tags
+            for name in COMPARED_PROPERTIES:
+                prop_diffs[name] |= getattr(g.properties, name) != getattr(first.properties, name)
+
         return templates.TemplateResponse(
             request, "compare.html", {"result": result.model_dump(), "prop_diffs": prop_diffs, "mechanisms": mechanisms_by_pair}
         )
-    return result
+    return json_response(result.model_dump_json())
 
 
 # These two endpoints are deliberately plain `def` (not async): they are pure,
@@ -784,7 +787,7 @@ def graph_eigenvalues(graph6: str):
     """Eigenvalue arrays for every plotted matrix, computed on demand from
     graph6. Loaded lazily by the detail and compare pages."""
     try:
-        return eigenvalues_for_viz(graph6)
+        return viz_eigenvalues(graph6)
     except Exception:
         raise HTTPException(status_code=400, detail=f"Invalid graph6: '{graph6}'")
 
@@ -796,10 +799,6 @@ def compare_distances(
     """Spectral distances for /compare, computed on demand. Returns a numeric
     per-matrix comparison for 2 graphs, and a full pairwise distance matrix for
     more than 2 (mirrors the shapes the compare page hydrates)."""
-    import numpy as np
-    from scipy.stats import wasserstein_distance
-    import ot
-
     graph6_list = [g.strip() for g in graphs.split(",")]
     if len(graph6_list) < 2:
         raise HTTPException(status_code=400, detail="Need at least 2 graphs to compare")
@@ -807,7 +806,7 @@ def compare_distances(
         raise HTTPException(status_code=400, detail="Maximum 10 graphs per comparison")
 
     try:
-        eigs_list = [eigenvalues_for_viz(g6) for g6 in graph6_list]
+        eigs_list = [viz_eigenvalues(g6) for g6 in graph6_list]
     except Exception:
         raise HTTPException(status_code=400, detail="Invalid graph6 in comparison")
 
@@ -819,16 +818,12 @@ def compare_distances(
             a2 = e2[f"{matrix}_eigenvalues"]
             if a1 is None or a2 is None or len(a1) != len(a2):
                 return None
-            return wasserstein_distance(a1, a2)
+            return wasserstein_sorted(a1, a2)
         re1, im1 = e1[f"{matrix}_eigenvalues_re"], e1[f"{matrix}_eigenvalues_im"]
         re2, im2 = e2[f"{matrix}_eigenvalues_re"], e2[f"{matrix}_eigenvalues_im"]
         if re1 is None or re2 is None or len(re1) != len(re2):
             return None
-        p1 = np.column_stack([re1, im1])
-        p2 = np.column_stack([re2, im2])
-        k = len(p1)
-        w = np.ones(k) / k
-        return ot.emd2(w, w, ot.dist(p1, p2, metric="euclidean"))
+        return wasserstein_points(np.column_stack([re1, im1]), np.column_stack([re2, im2]))
 
     matrices = [m for m in MATRIX_KEYS if m not in signature_keys()]
 
@@ -845,16 +840,19 @@ def compare_distances(
     n = len(graph6_list)
     distance_matrix_data = {}
     for matrix in matrices:
-        dm = [[0.0 for _ in range(n)] for _ in range(n)]
-        for i in range(n):
-            for j in range(i + 1, n):
-                dist = pair_distance(eigs_list[i], eigs_list[j], matrix)
-                if dist is not None and not np.isfinite(dist):
-                    dist = None
-                if dist is not None and dist < 1e-8:
-                    dist = 0.0
-                dm[i][j] = dm[j][i] = dist
-        distance_matrix_data[matrix] = dm
+        if matrix in real_keys():
+            # Every pair in one broadcast; NaN where a pair is not comparable.
+            dm = pairwise_wasserstein_sorted([e[f"{matrix}_eigenvalues"] for e in eigs_list])
+        else:
+            dm = np.zeros((n, n))
+            for i in range(n):
+                for j in range(i + 1, n):
+                    dist = pair_distance(eigs_list[i], eigs_list[j], matrix)
+                    dm[i, j] = dm[j, i] = np.nan if dist is None else dist
+        dm[dm < 1e-8] = 0.0
+        distance_matrix_data[matrix] = [
+            [float(d) if np.isfinite(d) else None for d in row] for row in dm
+        ]
     return {"spectral_comparison": None, "distance_matrix": distance_matrix_data}
 
 
@@ -880,16 +878,31 @@ async def api_docs(request: Request):
     return templates.TemplateResponse(request, "api_docs.html", {})
 
 
+# Stats only change when the database is regenerated, so the parsed Stats is
+# kept in-process for STATS_TTL seconds and clients may cache the JSON too.
+STATS_TTL = 60
+STATS_CACHE_CONTROL = f"public, max-age={STATS_TTL}, stale-while-revalidate=600"
+_stats_cache: tuple[float, Stats] | None = None
+
+
 @app.get("/stats")
 async def stats(request: Request):
     """Get database statistics (API)."""
-    t0 = time.perf_counter()
-    data = await get_stats()
-    logger.info(f"  get_stats: {(time.perf_counter()-t0)*1000:.0f}ms")
-    result = Stats(**data)
+    global _stats_cache
+    now = time.monotonic()
+    if _stats_cache is not None and now - _stats_cache[0] < STATS_TTL:
+        result = _stats_cache[1]
+    else:
+        t0 = time.perf_counter()
+        data = await get_stats()
+        logger.info(f"  get_stats: {(time.perf_counter()-t0)*1000:.0f}ms")
+        result = Stats(**data)
+        _stats_cache = (now, result)
 
     if wants_html(request):
         return templates.TemplateResponse(
             request, "stats.html", {"stats": result}
         )
-    return result
+    return json_response(
+        result.model_dump_json(), headers={"Cache-Control": STATS_CACHE_CONTROL}
+    )
@@ -168,7 +168,7 @@ def _nb_charpoly_key(G: nx.Graph) -> str | None:
     B = nonbacktracking_matrix(G)
     if B.shape[0] == 0:
         return None
-    M = [[int(round(float(x))) for x in row] for row in B]
+    M = np.rint(B).astype(np.int64).tolist()
     coeffs = [int(c) for c in fmpz_mat(M).charpoly().coeffs()]
     return charpoly_hash(coeffs)
 
@@ -183,16 +183,16 @@ def _nbl_charpoly_key(G: nx.Graph) -> str | None:
     B = nonbacktracking_matrix(G)
     if B.shape[0] == 0:
         return None
-    n = B.shape[0]
-    Bi = [[int(round(float(B[i][j]))) for j in range(n)] for i in range(n)]
-    deg = [sum(Bi[i]) for i in range(n)]
-    rows = []
-    for i in range(n):
-        di = deg[i]
-        if di > 0:
-            rows.append([fmpq((1 if i == j else 0) * di - Bi[i][j], di) for j in range(n)])
-        else:
-            rows.append([fmpq(1 if i == j else 0, 1) for j in range(n)])
+    Bi = np.rint(B).astype(np.int64)
+    # Row i of NBL is (d_i I - B)_i / d_i; a zero-out-degree row has B_i = 0, so
+    # taking d_i = 1 there leaves exactly the identity row.
+    deg = Bi.sum(axis=1)
+    deg[deg == 0] = 1
+    numer = np.diag(deg) - Bi
+    rows = [
+        [fmpq(x, di) for x in row]
+        for row, di in zip(numer.tolist(), deg.tolist())
+    ]
     coeffs = list(fmpq_mat(rows).charpoly().coeffs())  # monic rational charpoly
     den = 1
     for c in coeffs:
@@ -1,5 +1,6 @@
 """Graph data processing - combines all computations for a single graph."""
 
+import json
 import os
 from dataclasses import dataclass, fields, replace
 import numpy as np
@@ -73,7 +74,7 @@ def _complex_spectrum_or_none(M, size=None):
 # in exactly this order; consumers (e.g. scripts/generate.py) build their INSERT
 # column list from here so the two cannot drift apart.
 INSERT_COLUMNS = (
-    "n", "m", "graph6",
+    "n", "m", "graph6", "edges_json",
     "adj_eigenvalues", "adj_spectral_hash",
     "kirchhoff_eigenvalues", "kirchhoff_spectral_hash",
     "signless_eigenvalues", "signless_spectral_hash",
@@ -104,6 +105,10 @@ class GraphRecord:
     n: int
     m: int
 
+    # Edge list [[u, v], ...] as JSON, so the API can serve it without decoding
+    # graph6 on every request
+    edges_json: str
+
     # Adjacency spectrum
     adj_eigenvalues: np.ndarray
     adj_spectral_hash: str
@@ -179,6 +184,7 @@ class GraphRecord:
             self.n,
             self.m,
             self.graph6,
+            self.edges_json,
             self.adj_eigenvalues.tolist() if self.adj_eigenvalues is not None else None,
             self.adj_spectral_hash,
             self.kirchhoff_eigenvalues.tolist() if self.kirchhoff_eigenvalues is not None else None,
@@ -235,6 +241,20 @@ def _complex_arrays_or_none(M):
     return eigs.real.tolist(), eigs.imag.tolist()
 
 
+def _nb_spectra(G: nx.Graph) -> tuple[np.ndarray, np.ndarray]:
+    """NB and NB Laplacian eigenvalues, as compute_complex_eigenvalues returns them.
+
+    A forest has no non-backtracking closed walks, so its Hashimoto matrix B is
+    nilpotent: the NB spectrum is 2m zeros and the NBL spectrum (I - D^{-1}B) 2m
+    ones. Those are returned without building B or running the eigensolver.
+    """
+    m = G.number_of_edges()
+    if 0 < m < G.number_of_nodes() and nx.is_forest(G):
+        return np.zeros(2 * m, dtype=np.complex128), np.ones(2 * m, dtype=np.complex128)
+    B = nonbacktracking_matrix(G)
+    return compute_complex_eigenvalues(B), compute_complex_eigenvalues(nonbacktracking_laplacian(G, B))
+
+
 # The eigenvalue arrays the web viz plots. They are no longer stored in the
 # database (only the spectral hashes are), so the detail and compare pages
 # recompute them per request from graph6. The k-blocking family is excluded:
@@ -249,25 +269,25 @@ def eigenvalues_for_viz(graph6_str: str) -> dict:
     disconnected graph, or a nilpotent non-k-cycling operator).
     """
     G = graph_from_graph6(graph6_str)
+    A = adjacency_matrix(G)
     out = {
-        "adj_eigenvalues": compute_real_eigenvalues(adjacency_matrix(G)).tolist(),
-        "kirchhoff_eigenvalues": compute_real_eigenvalues(kirchhoff_laplacian(G)).tolist(),
-        "signless_eigenvalues": compute_real_eigenvalues(signless_laplacian(G)).tolist(),
-        "lap_eigenvalues": compute_real_eigenvalues(laplacian_matrix(G)).tolist(),
+        "adj_eigenvalues": compute_real_eigenvalues(A).tolist(),
+        "kirchhoff_eigenvalues": compute_real_eigenvalues(kirchhoff_laplacian(G, A)).tolist(),
+        "signless_eigenvalues": compute_real_eigenvalues(signless_laplacian(G, A)).tolist(),
+        "lap_eigenvalues": compute_real_eigenvalues(laplacian_matrix(G, A)).tolist(),
     }
-    nb = compute_complex_eigenvalues(nonbacktracking_matrix(G))
+    nb, nbl = _nb_spectra(G)
     out["nb_eigenvalues_re"], out["nb_eigenvalues_im"] = nb.real.tolist(), nb.imag.tolist()
-    nbl = compute_complex_eigenvalues(nonbacktracking_laplacian(G))
     out["nbl_eigenvalues_re"], out["nbl_eigenvalues_im"] = nbl.real.tolist(), nbl.imag.tolist()
 
     D_dist = distance_matrix(G)
     if D_dist is not None:
         out["dist_eigenvalues"] = compute_real_eigenvalues(D_dist).tolist()
-        out["distlap_eigenvalues"] = compute_real_eigenvalues(distance_laplacian(G)).tolist()
-        out["distsign_eigenvalues"] = compute_real_eigenvalues(distance_signless_laplacian(G)).tolist()
-        dn = normalized_distance_laplacian(G)
+        out["distlap_eigenvalues"] = compute_real_eigenvalues(distance_laplacian(G, D_dist)).tolist()
+        out["distsign_eigenvalues"] = compute_real_eigenvalues(distance_signless_laplacian(G, D_dist)).tolist()
+        dn = normalized_distance_laplacian(G, D_dist)
         out["distnorm_eigenvalues"] = compute_real_eigenvalues(dn).tolist() if dn is not None else None
-        ecc = eccentricity_matrix(G)
+        ecc = eccentricity_matrix(G, D_dist)
         out["ecc_eigenvalues"] = compute_real_eigenvalues(ecc).tolist() if ecc is not None else None
     else:
         out["dist_eigenvalues"] = None
@@ -276,8 +296,8 @@ def eigenvalues_for_viz(graph6_str: str) -> dict:
         out["distnorm_eigenvalues"] = None
         out["ecc_eigenvalues"] = None
 
-    y2 = yoon2_matrix(G)
-    y3 = yoon3_matrix(G)
+    y2 = yoon2_matrix(G, A)
+    y3 = yoon3_matrix(G, A)
     out["yoon2_eigenvalues"] = compute_real_eigenvalues(y2).tolist() if y2 is not None else None
     out["yoon3_eigenvalues"] = compute_real_eigenvalues(y3).tolist() if y3 is not None else None
 
@@ -297,13 +317,12 @@ def process_graph(G: nx.Graph, graph6_str: str) -> GraphRecord:
     Returns:
         GraphRecord with all computed properties
     """
-    # Compute matrices
+    # Compute matrices (A and D_dist are built once and shared by the builders
+    # derived from them)
     A = adjacency_matrix(G)
-    L_kirchhoff = kirchhoff_laplacian(G)
-    Q_signless = signless_laplacian(G)
-    L_normalized = laplacian_matrix(G)
-    B = nonbacktracking_matrix(G)
-    L_NB = nonbacktracking_laplacian(G)
+    L_kirchhoff = kirchhoff_laplacian(G, A)
+    Q_signless = signless_laplacian(G, A)
+    L_normalized = laplacian_matrix(G, A)
     D_dist = distance_matrix(G)  # None for disconnected graphs
 
     # Compute eigenvalues
@@ -311,8 +330,7 @@ def process_graph(G: nx.Graph, graph6_str: str) -> GraphRecord:
     kirchhoff_eigs = compute_real_eigenvalues(L_kirchhoff)
     signless_eigs = compute_real_eigenvalues(Q_signless)
     lap_eigs = compute_real_eigenvalues(L_normalized)
-    nb_eigs = compute_complex_eigenvalues(B)
-    nbl_eigs = compute_complex_eigenvalues(L_NB)
+    nb_eigs, nbl_eigs = _nb_spectra(G)
 
     # Compute hashes
     adj_hash = spectral_hash_real(adj_eigs)
@@ -326,12 +344,12 @@ def process_graph(G: nx.Graph, graph6_str: str) -> GraphRecord:
     if D_dist is not None:
         dist_eigs = compute_real_eigenvalues(D_dist)
         dist_hash = spectral_hash_real(dist_eigs)
-        distlap_eigs = compute_real_eigenvalues(distance_laplacian(G))
+        distlap_eigs = compute_real_eigenvalues(distance_laplacian(G, D_dist))
         distlap_hash = spectral_hash_real(distlap_eigs)
-        distsign_eigs = compute_real_eigenvalues(distance_signless_laplacian(G))
+        distsign_eigs = compute_real_eigenvalues(distance_signless_laplacian(G, D_dist))
         distsign_hash = spectral_hash_real(distsign_eigs)
-        distnorm_eigs, distnorm_hash = _real_spectrum_or_none(normalized_distance_laplacian(G))
-        ecc_eigs, ecc_hash = _real_spectrum_or_none(eccentricity_matrix(G))
+        distnorm_eigs, distnorm_hash = _real_spectrum_or_none(normalized_distance_laplacian(G, D_dist))
+        ecc_eigs, ecc_hash = _real_spectrum_or_none(eccentricity_matrix(G, D_dist))
     else:
         dist_eigs = dist_hash = None
         distlap_eigs = distlap_hash = None
@@ -351,16 +369,17 @@ def process_graph(G: nx.Graph, graph6_str: str) -> GraphRecord:
         n3_re, n3_im, n3_hash = _complex_spectrum_or_none(non3cyc_matrix(G))
         n4_re, n4_im, n4_hash = _complex_spectrum_or_none(non4cyc_matrix(G))
 
-    yoon2_eigs, yoon2_hash = _real_spectrum_or_none(yoon2_matrix(G))
-    yoon3_eigs, yoon3_hash = _real_spectrum_or_none(yoon3_matrix(G))
+    yoon2_eigs, yoon2_hash = _real_spectrum_or_none(yoon2_matrix(G, A))
+    yoon3_eigs, yoon3_hash = _real_spectrum_or_none(yoon3_matrix(G, A))
 
     # Compute metadata
-    meta = compute_metadata(G)
+    meta = compute_metadata(G, D_dist)
 
     record = GraphRecord(
         graph6=graph6_str,
         n=meta["n"],
         m=meta["m"],
+        edges_json=json.dumps(edges_from_graph6(graph6_str)),
         adj_eigenvalues=adj_eigs,
         adj_spectral_hash=adj_hash,
         kirchhoff_eigenvalues=kirchhoff_eigs,
@@ -419,3 +438,32 @@ def process_graph(G: nx.Graph, graph6_str: str) -> GraphRecord:
 def graph_from_graph6(graph6_str: str) -> nx.Graph:
     """Parse a graph6 string into a NetworkX graph."""
     return nx.from_graph6_bytes(graph6_str.encode("ascii"))
+
+
+def edges_from_graph6(graph6_str: str) -> list[tuple[int, int]]:
+    """
+    Decode a graph6 string straight into its edge list, without building a
+    NetworkX graph. Edges are (u, v) with u < v, ordered by u then v, as
+    iterating the decoded NetworkX graph's edges gives them.
+    """
+    data = [c - 63 for c in graph6_str.encode("ascii")]
+    if data and data[0] == 63:  # n >= 63: 18- or 36-bit size after '~' markers
+        if len(data) > 1 and data[1] == 63:
+            size, data = data[2:8], data[8:]
+        else:
+            size, data = data[1:4], data[4:]
+        n = 0
+        for d in size:
+            n = (n << 6) | d
+    else:
+        n, data = data[0], data[1:]
+
+    edges = []
+    bit = 0
+    for v in range(1, n):
+        for u in range(v):
+            if data[bit // 6] >> (5 - bit % 6) & 1:
+                edges.append((u, v))
+            bit += 1
+    # The bits run v-major; sort into the u-major order the API has always served.
+    return sorted(edges)
@@ -4,6 +4,7 @@ from math import comb
 
 import numpy as np
 import networkx as nx
+import scipy.sparse as sp
 
 
 def adjacency_matrix(G: nx.Graph) -> np.ndarray:
@@ -11,7 +12,7 @@ def adjacency_matrix(G: nx.Graph) -> np.ndarray:
     return nx.to_numpy_array(G, dtype=np.float64)
 
 
-def kirchhoff_laplacian(G: nx.Graph) -> np.ndarray:
+def kirchhoff_laplacian(G: nx.Graph, A: np.ndarray | None = None) -> np.ndarray:
     """
     Return the Kirchhoff (combinatorial) Laplacian L = D - A.
 
@@ -19,14 +20,19 @@ def kirchhoff_laplacian(G: nx.Graph) -> np.ndarray:
     - Eigenvalues: 0 = λ₁ ≤ λ₂ ≤ ... ≤ λₙ
     - λ₂ is the algebraic connectivity (Fiedler value)
     - Related to spanning trees, cuts, and graph connectivity
+
+    Like the other adjacency-derived builders, accepts an already-built
+    adjacency_matrix(G) as ``A`` so callers building several matrices of one
+    graph convert it only once.
     """
-    A = adjacency_matrix(G)
+    if A is None:
+        A = adjacency_matrix(G)
     degrees = A.sum(axis=1)
     D = np.diag(degrees)
     return D - A
 
 
-def signless_laplacian(G: nx.Graph) -> np.ndarray:
+def signless_laplacian(G: nx.Graph, A: np.ndarray | None = None) -> np.ndarray:
     """
     Return the signless Laplacian Q = D + A.
 
@@ -35,33 +41,33 @@ def signless_laplacian(G: nx.Graph) -> np.ndarray:
     - Related to chromatic number and bipartiteness detection
     - Largest eigenvalue is related to maximum degree
     """
-    A = adjacency_matrix(G)
+    if A is None:
+        A = adjacency_matrix(G)
     degrees = A.sum(axis=1)
     D = np.diag(degrees)
     return D + A
 
 
-def laplacian_matrix(G: nx.Graph) -> np.ndarray:
+def laplacian_matrix(G: nx.Graph, A: np.ndarray | None = None) -> np.ndarray:
     """
     Return the symmetric normalized Laplacian L = I - D^{-1/2}AD^{-1/2}.
 
     This has the same eigenvalues as the random walk Laplacian I - D^{-1}A
     (they are similar matrices), but is symmetric so we can use eigvalsh.
     """
-    A = adjacency_matrix(G)
+    if A is None:
+        A = adjacency_matrix(G)
     n = A.shape[0]
     degrees = A.sum(axis=1)
 
-    if np.any(degrees == 0):
-        degrees_safe = np.where(degrees == 0, 1.0, degrees)
-        D_inv_sqrt = np.diag(1.0 / np.sqrt(degrees_safe))
-        zero_mask = degrees == 0
-        D_inv_sqrt[zero_mask, :] = 0
-        D_inv_sqrt[:, zero_mask] = 0
-    else:
-        D_inv_sqrt = np.diag(1.0 / np.sqrt(degrees))
+    # D^{-1/2} as a vector (0 for isolated vertices, leaving their rows as the
+    # identity). Scaling A's rows and columns by it is D^{-1/2} A D^{-1/2}
+    # without forming the diagonal matrices or two dense matrix products.
+    inv_sqrt = np.divide(
+        1.0, np.sqrt(degrees), out=np.zeros_like(degrees), where=degrees != 0
+    )
 
-    return np.eye(n) - D_inv_sqrt @ A @ D_inv_sqrt
+    return np.eye(n) - inv_sqrt[:, None] * A * inv_sqrt[None, :]
 
 
 def _build_directed_edges(G: nx.Graph) -> list[tuple[int, int]]:
@@ -87,51 +93,62 @@ def nonbacktracking_matrix(G: nx.Graph) -> np.ndarray:
     without backtracking), and 0 otherwise.
 
     Returns a 2m x 2m matrix where m is the number of edges.
+
+    Built with index arrays rather than a per-edge Python loop: directed edges
+    are sorted by tail, so the edges leaving v form one contiguous block, and
+    every candidate transition (u, v) -> (v, x) is enumerated at once.
     """
     if G.number_of_edges() == 0:
         return np.array([]).reshape(0, 0)
 
     directed_edges = _build_directed_edges(G)
-    edge_to_idx = {e: i for i, e in enumerate(directed_edges)}
+    # Sorted labels map monotonically to positions, so tail/head inherit the
+    # directed-edge order.
+    pos = {v: i for i, v in enumerate(sorted(G.nodes()))}
+    tail = np.array([pos[u] for u, _ in directed_edges])
+    head = np.array([pos[v] for _, v in directed_edges])
     num_edges = len(directed_edges)
 
-    B = np.zeros((num_edges, num_edges), dtype=np.float64)
+    out_deg = np.bincount(tail, minlength=len(pos))
+    block_start = np.cumsum(out_deg) - out_deg
 
-    for e_idx, (u, v) in enumerate(directed_edges):
-        for neighbor in G.neighbors(v):
-            if neighbor != u:
-                f = (v, neighbor)
-                f_idx = edge_to_idx[f]
-                B[e_idx, f_idx] = 1.0
+    # For edge e, the candidates are the out_deg[head[e]] edges leaving head[e].
+    counts = out_deg[head]
+    rows = np.repeat(np.arange(num_edges), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    cols = block_start[head][rows] + offsets
+    keep = head[cols] != tail[rows]  # drop the backtracking step (v, u)
 
+    B = np.zeros((num_edges, num_edges), dtype=np.float64)
+    B[rows[keep], cols[keep]] = 1.0
     return B
 
 
-def nonbacktracking_laplacian(G: nx.Graph) -> np.ndarray:
+def nonbacktracking_laplacian(G: nx.Graph, B: np.ndarray | None = None) -> np.ndarray:
     """
     Return the non-backtracking Laplacian matrix.
 
     L_NB = I - D^{-1} B
 
     where B is the non-backtracking (Hashimoto) matrix and D is the diagonal
-    matrix of out-degrees in the NB graph.
+    matrix of out-degrees in the NB graph. Pass an already-built
+    nonbacktracking_matrix(G) as ``B`` to avoid rebuilding it.
     """
-    B = nonbacktracking_matrix(G)
+    if B is None:
+        B = nonbacktracking_matrix(G)
 
     if B.size == 0:
         return np.array([]).reshape(0, 0)
 
+    # Inverse out-degree per directed edge, computed once (0 where an edge has
+    # no NB successor, leaving its row as the identity). Scaling B's rows by it
+    # is D^{-1} B without forming D^{-1} or a dense matrix product.
     out_degrees = B.sum(axis=1)
+    inv_out = np.divide(
+        1.0, out_degrees, out=np.zeros_like(out_degrees), where=out_degrees != 0
+    )
 
-    if np.any(out_degrees == 0):
-        out_degrees_safe = np.where(out_degrees == 0, 1.0, out_degrees)
-        D_inv = np.diag(1.0 / out_degrees_safe)
-        zero_mask = out_degrees == 0
-        D_inv[zero_mask, :] = 0
-    else:
-        D_inv = np.diag(1.0 / out_degrees)
-
-    return np.eye(B.shape[0]) - D_inv @ B
+    return np.eye(B.shape[0]) - B * inv_out[:, None]
 
 
 def distance_matrix(G: nx.Graph) -> np.ndarray | None:
@@ -144,23 +161,18 @@ def distance_matrix(G: nx.Graph) -> np.ndarray | None:
     Note: This matrix is typically not stored directly; we only compute and
     store its spectrum for cospectral analysis.
     """
-    if not nx.is_connected(G):
-        return None
-
     n = G.number_of_nodes()
     if n == 0:
         return np.array([]).reshape(0, 0)
 
-    D = np.zeros((n, n), dtype=np.float64)
-    node_list = list(G.nodes())
-
+    # One all-pairs BFS serves as the connectivity test too: the graph is
+    # connected iff the first vertex reaches all n vertices.
+    nodes = list(G.nodes())
     lengths = dict(nx.all_pairs_shortest_path_length(G))
+    if len(lengths[nodes[0]]) != n:
+        return None
 
-    for i, u in enumerate(node_list):
-        for j, v in enumerate(node_list):
-            D[i, j] = lengths[u][v]
-
-    return D
+    return np.array([[lengths[u][v] for v in nodes] for u in nodes], dtype=np.float64)
 
 
 def cycle_core(G: nx.Graph, k: int) -> nx.Graph:
@@ -172,13 +184,14 @@ def cycle_core(G: nx.Graph, k: int) -> nx.Graph:
     then keeps only the cyclic part (iteratively remove degree < 2). May be
     empty.
     """
-    Gk = G.subgraph([v for v in G.nodes() if G.degree(v) >= k]).copy()
+    # A read-only view is enough: k_core already returns a copy.
+    Gk = G.subgraph([v for v, d in G.degree() if d >= k])
     if Gk.number_of_nodes() == 0:
         return nx.Graph()
     return nx.k_core(Gk, k=2)
 
 
-def kblocking_matrix(G: nx.Graph, k: int) -> np.ndarray:
+def kblocking_matrix(G: nx.Graph, k: int, core: nx.Graph | None = None) -> np.ndarray:
     """
     Return the degree-weighted non-backtracking matrix D_k B_k whose spectrum
     equals that of the k-blocking operator M_k (Torres 2026, trace formula).
@@ -187,14 +200,17 @@ def kblocking_matrix(G: nx.Graph, k: int) -> np.ndarray:
     directed edges (u, v); D_k is diagonal with D_k[(u,v)] = C(d_G(v) - 2, k - 2)
     using the *global* degree of v in G. Returns a 0x0 array when H_k is empty.
     For k = 2 this reduces to the ordinary non-backtracking matrix.
+
+    Pass a precomputed cycle_core(G, k) as ``core`` to avoid rebuilding it.
     """
-    Hk = cycle_core(G, k)
+    Hk = cycle_core(G, k) if core is None else core
     if Hk.number_of_edges() == 0:
         return np.array([]).reshape(0, 0)
     B = nonbacktracking_matrix(Hk)
     edges = _build_directed_edges(Hk)
+    deg = dict(G.degree())
     weights = np.array(
-        [comb(G.degree(v) - 2, k - 2) for (_, v) in edges], dtype=np.float64
+        [comb(deg[v] - 2, k - 2) for (_, v) in edges], dtype=np.float64
     )
     return weights[:, None] * B  # diag(weights) @ B
 
@@ -209,7 +225,7 @@ def kblock4_matrix(G: nx.Graph) -> np.ndarray:
     return kblocking_matrix(G, 4)
 
 
-def kblocking_size(G: nx.Graph, k: int) -> int:
+def kblocking_size(G: nx.Graph, k: int, core: nx.Graph | None = None) -> int:
     """
     Number of states of the k-blocking operator M_k, i.e. its dimension:
     |states(M_k)| = sum over directed edges (u,v) of H_k of C(d_G(v)-1, k-2).
@@ -218,10 +234,11 @@ def kblocking_size(G: nx.Graph, k: int) -> int:
     dimension), so this is folded into the k-blocking hash for exact M_k
     cospectrality.
     """
-    Hk = cycle_core(G, k)
+    Hk = cycle_core(G, k) if core is None else core
     if Hk.number_of_edges() == 0:
         return 0
-    return sum(comb(G.degree(v) - 1, k - 2) for (_, v) in _build_directed_edges(Hk))
+    deg = dict(G.degree())
+    return sum(comb(deg[v] - 1, k - 2) for (_, v) in _build_directed_edges(Hk))
 
 
 def kblock3_size(G: nx.Graph) -> int:
@@ -232,7 +249,7 @@ def kblock4_size(G: nx.Graph) -> int:
     return kblocking_size(G, 4)
 
 
-def open_path_matrix(G: nx.Graph, k: int) -> np.ndarray:
+def open_path_matrix(G: nx.Graph, k: int, A: np.ndarray | None = None) -> np.ndarray:
     """
     Yoon's length-k open path matrix P_{G,k}: (i,j) entry is the number of
     open (simple) paths of length k from v_i to v_j, with zero diagonal.
@@ -241,7 +258,8 @@ def open_path_matrix(G: nx.Graph, k: int) -> np.ndarray:
       P_{G,2} = A^2 with zeroed diagonal (= common-neighbor counts),
       P_{G,3} = A^3 - (d_i + d_j - 1) A_{ij}, zeroed diagonal.
     """
-    A = adjacency_matrix(G)
+    if A is None:
+        A = adjacency_matrix(G)
     if k == 1:
         return A
     if k == 2:
@@ -261,31 +279,32 @@ def _yoon_coefficient(k: int, m: int) -> float:
     return (-1) ** (k + 1) * 2 * comb(2 * m, m - k) / (k ** 2 * comb(2 * m, m))
 
 
-def m_laplacian(G: nx.Graph, m: int) -> np.ndarray | None:
+def m_laplacian(G: nx.Graph, m: int, A: np.ndarray | None = None) -> np.ndarray | None:
     """
     Yoon's m-Laplacian L^{(m)}_G: the Laplacian of the reweighted (signed)
     graph whose adjacency is sum_{k=1}^m a_{k,m} P_{G,k}. Real symmetric.
 
     Defined only for n > m (returns None otherwise); m=1 is the Kirchhoff
-    Laplacian. Cross-checked against Remark 6.1 (m=2) and Prop 6.2.
+    Laplacian. Cross-checked against Remark 6.1 (m=2) and Prop 6.2. ``A`` is
+    shared by every open-path term.
     """
     n = G.number_of_nodes()
     if n <= m:
         return None
     W = np.zeros((n, n), dtype=np.float64)
     for k in range(1, m + 1):
-        W += _yoon_coefficient(k, m) * open_path_matrix(G, k)
+        W += _yoon_coefficient(k, m) * open_path_matrix(G, k, A)
     return np.diag(W.sum(axis=1)) - W
 
 
-def yoon2_matrix(G: nx.Graph) -> np.ndarray | None:
+def yoon2_matrix(G: nx.Graph, A: np.ndarray | None = None) -> np.ndarray | None:
     """Yoon 2-Laplacian (2m=4th-order accuracy). None for n <= 2."""
-    return m_laplacian(G, 2)
+    return m_laplacian(G, 2, A)
 
 
-def yoon3_matrix(G: nx.Graph) -> np.ndarray | None:
+def yoon3_matrix(G: nx.Graph, A: np.ndarray | None = None) -> np.ndarray | None:
     """Yoon 3-Laplacian (2m=6th-order accuracy). None for n <= 3."""
-    return m_laplacian(G, 3)
+    return m_laplacian(G, 3, A)
 
 
 def _source_target(M: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
@@ -305,6 +324,21 @@ def _source_target(M: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
     return L, R
 
 
+def _sparse_source_target(M: sp.csr_array) -> tuple[sp.csr_array, sp.csr_array]:
+    """Sparse _source_target, with edges in the same (row-major) order.
+
+    Drops explicit zeros and sorts M's indices in place.
+    """
+    M.eliminate_zeros()
+    M.sort_indices()
+    coo = M.tocoo()
+    m, N = coo.nnz, M.shape[0]
+    edges, ones = np.arange(m), np.ones(m)
+    L = sp.csr_array((ones, (edges, coo.row)), shape=(m, N))
+    R = sp.csr_array((ones, (edges, coo.col)), shape=(m, N))
+    return L, R
+
+
 def non_k_cycling_matrix(G: nx.Graph, k: int) -> np.ndarray:
     """
     Arrigo-Noferini non-k-cycling matrix P_k (Def. 5.2 / Thm 5.3), built by the
@@ -316,14 +350,20 @@ def non_k_cycling_matrix(G: nx.Graph, k: int) -> np.ndarray:
     (non-symmetric). Trees and graphs whose cycles are all shorter than k give a
     nilpotent (all-zero spectrum) matrix.
     """
-    P = adjacency_matrix(G).astype(np.float64)
+    P = sp.csr_array(adjacency_matrix(G).astype(np.float64))
     for level in range(2, k + 1):
         if P.shape[0] == 0:
             break
-        L, R = _source_target(P)
-        W = R @ L.T
-        P = W - W * np.linalg.matrix_power(W.T, level - 1)
-    return P
+        L, R = _sparse_source_target(P)
+        W = (R @ L.T).tocsr()
+        # Only the entries of (W^T)^{level-1} on W's support survive the
+        # Hadamard product, so keep the power sparse instead of densifying it.
+        Wt = W.T.tocsr()
+        power = Wt
+        for _ in range(level - 2):
+            power = power @ Wt
+        P = (W - W.multiply(power)).tocsr()
+    return P.toarray()
 
 
 def non3cyc_matrix(G: nx.Graph) -> np.ndarray:
@@ -336,36 +376,41 @@ def non4cyc_matrix(G: nx.Graph) -> np.ndarray:
     return non_k_cycling_matrix(G, 4)
 
 
-def distance_laplacian(G: nx.Graph) -> np.ndarray | None:
+def distance_laplacian(G: nx.Graph, Dist: np.ndarray | None = None) -> np.ndarray | None:
     """
     Return the distance Laplacian D_L = Tr - Dist.
 
     Tr is the diagonal matrix of vertex transmissions (row sums of the distance
     matrix) and Dist is the distance matrix. Real symmetric, positive
     semidefinite. Only defined for connected graphs (returns None otherwise).
+
+    The distance-derived builders accept an already-computed
+    distance_matrix(G) as ``Dist``, sparing a repeat all-pairs BFS.
     """
-    Dist = distance_matrix(G)
+    if Dist is None:
+        Dist = distance_matrix(G)
     if Dist is None:
         return None
     Tr = np.diag(Dist.sum(axis=1))
     return Tr - Dist
 
 
-def distance_signless_laplacian(G: nx.Graph) -> np.ndarray | None:
+def distance_signless_laplacian(G: nx.Graph, Dist: np.ndarray | None = None) -> np.ndarray | None:
     """
     Return the distance signless Laplacian D_Q = Tr + Dist.
 
     The positive counterpart to the distance Laplacian. Real symmetric.
     Only defined for connected graphs (returns None otherwise).
     """
-    Dist = distance_matrix(G)
+    if Dist is None:
+        Dist = distance_matrix(G)
     if Dist is None:
         return None
     Tr = np.diag(Dist.sum(axis=1))
     return Tr + Dist
 
 
-def normalized_distance_laplacian(G: nx.Graph) -> np.ndarray | None:
+def normalized_distance_laplacian(G: nx.Graph, Dist: np.ndarray | None = None) -> np.ndarray | None:
     """
     Return the normalized distance Laplacian I - T^{-1/2} Dist T^{-1/2}, where
     T = diag(transmissions), transmission t(v) = sum_u d(v,u). Equivalently
@@ -374,7 +419,8 @@ def normalized_distance_laplacian(G: nx.Graph) -> np.ndarray | None:
     Reinhart (2019). Real symmetric, PSD, spectral radius < 2. Connected graphs
     only (returns None otherwise); also None for n < 2 (transmission 0).
     """
-    Dist = distance_matrix(G)
+    if Dist is None:
+        Dist = distance_matrix(G)
     if Dist is None or Dist.shape[0] < 2:
         return None
     t = Dist.sum(axis=1)
@@ -384,7 +430,7 @@ def normalized_distance_laplacian(G: nx.Graph) -> np.ndarray | None:
     return np.eye(len(t)) - (inv[:, None] * Dist * inv[None, :])
 
 
-def eccentricity_matrix(G: nx.Graph) -> np.ndarray | None:
+def eccentricity_matrix(G: nx.Graph, Dist: np.ndarray | None = None) -> np.ndarray | None:
     """
     Return the eccentricity matrix eps, where eps[i,j] = d(i,j) when
     d(i,j) = min(ecc(i), ecc(j)) and 0 otherwise; ecc(v) = max_u d(v,u).
@@ -392,7 +438,8 @@ def eccentricity_matrix(G: nx.Graph) -> np.ndarray | None:
 
     Mahato et al. (2019). Real symmetric. Connected graphs only (None otherwise).
     """
-    Dist = distance_matrix(G)
+    if Dist is None:
+        Dist = distance_matrix(G)
     if Dist is None or Dist.shape[0] == 0:
         return None
     ecc = Dist.max(axis=1)
@@ -1,14 +1,52 @@
 """Graph metadata computation."""
 
 import networkx as nx
+import numpy as np
 
 
-def compute_metadata(G: nx.Graph) -> dict:
+def _is_planar(G: nx.Graph, n: int, m: int, is_bipartite: bool) -> bool:
+    """Planarity, settled from the edge count alone where possible.
+
+    A non-planar graph contains a subdivision of K5 or K3,3, so it has at
+    least 9 edges; a planar graph on n >= 3 vertices has at most 3n - 6 edges
+    (2n - 4 if bipartite, having no triangles). Only the graphs in between
+    need the (comparatively slow) LR planarity test.
+    """
+    if m < 9:
+        return True
+    if m > (2 * n - 4 if is_bipartite else 3 * n - 6):
+        return False
+    return nx.check_planarity(G)[0]
+
+
+def _hop_distances(A: np.ndarray) -> np.ndarray:
+    """All-pairs hop distances (inf if unreachable) by BFS from every vertex
+    at once: each level's frontier is one boolean matrix product. For graphs
+    this small it beats both per-vertex Python BFS and scipy's csgraph, whose
+    per-call overhead dominates."""
+    n = A.shape[0]
+    adj = A.astype(bool)
+    Dist = np.full((n, n), np.inf)
+    np.fill_diagonal(Dist, 0.0)
+    reached = np.eye(n, dtype=bool)
+    frontier = reached
+    k = 0
+    while frontier.any():
+        k += 1
+        frontier = (frontier @ adj) & ~reached
+        Dist[frontier] = k
+        reached |= frontier
+    return Dist
+
+
+def compute_metadata(G: nx.Graph, Dist: np.ndarray | None = None) -> dict:
     """
     Compute structural metadata for a graph.
 
     Args:
         G: A networkx Graph
+        Dist: Optional precomputed distance_matrix(G) of a connected G, reused
+            for the eccentricities instead of recomputing all distances
 
     Returns:
         Dictionary with metadata fields
@@ -21,13 +59,19 @@ def compute_metadata(G: nx.Graph) -> dict:
     max_degree = max(degrees) if degrees else 0
 
     is_bipartite = nx.is_bipartite(G)
-    is_planar, _ = nx.check_planarity(G)
+    is_planar = _is_planar(G, n, m, is_bipartite)
     is_regular = min_degree == max_degree
 
-    if nx.is_connected(G) and n > 0:
-        eccentricities = nx.eccentricity(G)
-        diameter = max(eccentricities.values())
-        radius = min(eccentricities.values())
+    A = nx.to_numpy_array(G, dtype=np.int64)
+
+    # Eccentricities from the all-pairs distance matrix; an infinite distance
+    # means G is disconnected.
+    if Dist is None:
+        Dist = _hop_distances(A)
+    if n > 0 and np.isfinite(Dist).all():
+        eccentricities = Dist.max(axis=1)
+        diameter = int(eccentricities.max())
+        radius = int(eccentricities.min())
     else:
         diameter = None
         radius = None
@@ -36,7 +80,8 @@ def compute_metadata(G: nx.Graph) -> dict:
     if girth == float("inf"):
         girth = None  # Acyclic graph
 
-    triangle_count = sum(nx.triangles(G).values()) // 3
+    # Closed 3-walks: tr(A^3) = sum((A @ A) * A) counts each triangle 6 times.
+    triangle_count = int(((A @ A) * A).sum()) // 6
 
     return {
         "n": n,
@@ -0,0 +1,18 @@
+"""Process-pool support shared by the batch scripts."""
+
+import os
+
+BLAS_THREAD_VARS = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS")
+
+
+def pin_blas_threads() -> None:
+    """Default BLAS/LAPACK to one thread per process.
+
+    The batch scripts already spread graphs across every core with a process
+    pool; a threaded BLAS in each worker would only oversubscribe them on these
+    small matrices. BLAS reads these variables when numpy is first imported, so
+    call this before importing numpy (or anything that imports it). Values
+    already set in the environment are left alone.
+    """
+    for var in BLAS_THREAD_VARS:
+        os.environ.setdefault(var, "1")
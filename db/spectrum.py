@@ -6,6 +6,12 @@ from numpy.linalg import eigvalsh, eigvals
 
 PRECISION = 8
 
+# Bound str.format methods for the hash canonical forms. Mapped over
+# .tolist() they give exactly the f"{x:.{PRECISION}f}" strings, at a fraction
+# of the cost of formatting numpy scalars one by one in a generator.
+_FMT_REAL = f"{{:.{PRECISION}f}}".format
+_FMT_COMPLEX = f"({{:.{PRECISION}f}},{{:.{PRECISION}f}})".format
+
 
 # ---------------------------------------------------------------------------
 # Exact characteristic polynomial via Bareiss algorithm
@@ -81,21 +87,27 @@ def nb_charpoly(adjacency: np.ndarray) -> list[int]:
 
     M(z) = I - zA + z²(D - I), where A is the adjacency matrix and D the
     degree matrix. Returns integer coefficients [c₀, c₁, ..., c_{2n}] of
-    det(M(z)) = c₀ + c₁z + ... + c_{2n}z^{2n}.
+    det(M(z)) = c₀ + c₁z + ... + c_{2n}z^{2n}, trailing zeros dropped.
 
-    Uses Bareiss algorithm — exact integer arithmetic, no floating point.
+    det(M(z)) is the reversal of p(λ) = det(λ²I - λA + (D - I)), which is
+    the characteristic polynomial of the 2n×2n integer companion matrix
+    [[A, I - D], [I, 0]]. That charpoly is computed exactly by FLINT, instead
+    of a Bareiss elimination over polynomial entries.
     """
+    from flint import fmpz_mat
+
     n = adjacency.shape[0]
-    A = adjacency.astype(int)
-    degs = A.sum(axis=1)
-    M_polys = [[None] * n for _ in range(n)]
-    for i in range(n):
-        for j in range(n):
-            if i == j:
-                M_polys[i][j] = [1, -int(A[i, j]), int(degs[i]) - 1]
-            else:
-                M_polys[i][j] = [0, -int(A[i, j]), 0]
-    return bareiss_poly_det(M_polys, n)
+    A = adjacency.astype(np.int64)
+    eye = np.eye(n, dtype=np.int64)
+    C = np.block([
+        [A, eye - np.diag(A.sum(axis=1))],
+        [eye, np.zeros((n, n), dtype=np.int64)],
+    ])
+    p = [int(c) for c in fmpz_mat(C.tolist()).charpoly().coeffs()]
+    result = p[::-1]
+    while len(result) > 1 and result[-1] == 0:
+        result.pop()
+    return result
 
 
 def charpoly_hash(coeffs) -> str:
@@ -114,8 +126,7 @@ def compute_real_eigenvalues(matrix: np.ndarray) -> np.ndarray:
     """
     if matrix.size == 0:
         return np.array([], dtype=np.float64)
-    eigs = eigvalsh(matrix)
-    eigs = np.sort(eigs)
+    eigs = eigvalsh(matrix)  # already ascending
     eigs = np.round(eigs, decimals=PRECISION)
     eigs = np.where(eigs == 0, 0.0, eigs)  # Handle -0.0
     return eigs
@@ -175,7 +186,7 @@ def spectral_hash_real(eigenvalues: np.ndarray, extra: str = "") -> str:
     if eigenvalues.size == 0:
         return hashlib.sha256(("empty" + extra).encode()).hexdigest()[:16]
 
-    canonical = ",".join(f"{x:.{PRECISION}f}" for x in eigenvalues) + extra
+    canonical = ",".join(map(_FMT_REAL, eigenvalues.tolist())) + extra
     return hashlib.sha256(canonical.encode()).hexdigest()[:16]
 
 
@@ -207,8 +218,7 @@ def spectral_hash_complex(eigenvalues: np.ndarray, extra: str = "") -> str:
     half = _half_spectrum(eigenvalues)
 
     canonical = ",".join(
-        f"({r:.{PRECISION}f},{i:.{PRECISION}f})"
-        for r, i in zip(half.real, half.imag)
+        map(_FMT_COMPLEX, half.real.tolist(), half.imag.tolist())
     ) + extra
     return hashlib.sha256(canonical.encode()).hexdigest()[:16]
 
@@ -229,13 +239,17 @@ def kblock_family_signature(graph) -> str | None:
 
     parts = []
     k = 2
-    while cycle_core(graph, k).number_of_edges() > 0:
+    # Build each cycle core once and share it with both the matrix and the
+    # state count, rather than re-deriving it three times per member.
+    core = cycle_core(graph, k)
+    while core.number_of_edges() > 0:
         member = spectral_hash_complex(
-            compute_complex_eigenvalues(kblocking_matrix(graph, k)),
-            extra=f"|states={kblocking_size(graph, k)}",
+            compute_complex_eigenvalues(kblocking_matrix(graph, k, core=core)),
+            extra=f"|states={kblocking_size(graph, k, core=core)}",
         )
         parts.append(f"k{k}={member}")
         k += 1
+        core = cycle_core(graph, k)
     if not parts:
         return None
     return hashlib.sha256("|".join(parts).encode()).hexdigest()[:16]
@@ -4,6 +4,7 @@ Detects special graph types and returns a list of tags.
 """
 
 import networkx as nx
+import numpy as np
 
 
 def compute_tags(G: nx.Graph) -> list[str]:
@@ -26,9 +27,10 @@ def compute_tags(G: nx.Graph) -> list[str]:
     min_deg = min(degrees)
     max_deg = max(degrees)
     is_connected = nx.is_connected(G) if n > 0 else False
+    is_bipartite = nx.is_bipartite(G)
 
     # Bipartite: graph can be two-colored
-    if nx.is_bipartite(G):
+    if is_bipartite:
         tags.append("bipartite")
 
     # Planar: graph can be drawn without edge crossings
@@ -72,7 +74,7 @@ def compute_tags(G: nx.Graph) -> list[str]:
             tags.append("wheel")
 
     # Complete bipartite: bipartite and m = |A| * |B|
-    if nx.is_bipartite(G) and is_connected:
+    if is_bipartite and is_connected:
         try:
             A, B = nx.bipartite.sets(G)
             if m == len(A) * len(B):
@@ -94,30 +96,18 @@ def compute_tags(G: nx.Graph) -> list[str]:
     if min_deg == max_deg == 3:
         tags.append("cubic")
 
-    # Triangle-free: no triangles
-    if nx.triangles(G).get(0, 0) == 0 and sum(nx.triangles(G).values()) == 0:
+    # Triangle-free: no triangles, i.e. tr(A^3) = sum((A @ A) * A) is zero
+    A = nx.to_numpy_array(G, dtype=np.int64)
+    if not ((A @ A) * A).any():
         tags.append("triangle-free")
 
     # Complete multipartite: complement is a disjoint union of cliques
     # A graph is complete multipartite iff its complement is a union of cliques (no edges between cliques)
     if is_connected and n >= 2:
-        complement = nx.complement(G)
-        components = list(nx.connected_components(complement))
-        # Check each component is a clique (complete subgraph)
-        is_all_cliques = True
-        for comp in components:
-            comp_nodes = list(comp)
-            subgraph = complement.subgraph(comp_nodes)
-            # A clique has n*(n-1)/2 edges
-            expected_edges = len(comp_nodes) * (len(comp_nodes) - 1) // 2
-            if subgraph.number_of_edges() != expected_edges:
-                is_all_cliques = False
-                break
-        if is_all_cliques:
-            # Already have complete and complete-bipartite, this is for 3+ parts
-            num_parts = len(components)
-            if num_parts >= 3:
-                tags.append("complete-multipartite")
+        num_parts = _complete_multipartite_parts(G)
+        # Already have complete and complete-bipartite, this is for 3+ parts
+        if num_parts is not None and num_parts >= 3:
+            tags.append("complete-multipartite")
 
     # Prism: C_n □ K_2 (two cycles connected by matching)
     # n must be even, 3-regular, m = 3n/2
@@ -181,52 +171,70 @@ def compute_tags(G: nx.Graph) -> list[str]:
 def _check_strongly_regular(G: nx.Graph, n: int, k: int) -> tuple | None:
     """Check if G is strongly regular, return (n, k, λ, μ) or None."""
     nodes = list(G.nodes())
-    adj_set = {v: set(G.neighbors(v)) for v in nodes}
-
-    # Find λ (common neighbors of adjacent pair)
+    pos = {v: i for i, v in enumerate(nodes)}
+    # Neighbourhoods as int bitmasks: a common-neighbour count is one AND and
+    # a popcount instead of a set intersection.
+    nbrs = [0] * len(nodes)
+    for u, v in G.edges():
+        nbrs[pos[u]] |= 1 << pos[v]
+        nbrs[pos[v]] |= 1 << pos[u]
+
+    # λ: common neighbours of adjacent pairs; μ: of non-adjacent pairs
     lambda_val = None
-    for u in nodes:
-        for v in adj_set[u]:
-            if u < v:
-                common = len(adj_set[u] & adj_set[v])
+    mu_val = None
+    for i in range(len(nodes)):
+        for j in range(i + 1, len(nodes)):
+            common = (nbrs[i] & nbrs[j]).bit_count()
+            if nbrs[i] >> j & 1:
                 if lambda_val is None:
                     lambda_val = common
                 elif common != lambda_val:
                     return None
-
-    # Find μ (common neighbors of non-adjacent pair)
-    mu_val = None
-    for u in nodes:
-        for v in nodes:
-            if u < v and v not in adj_set[u]:
-                common = len(adj_set[u] & adj_set[v])
-                if mu_val is None:
-                    mu_val = common
-                elif common != mu_val:
-                    return None
+            elif mu_val is None:
+                mu_val = common
+            elif common != mu_val:
+                return None
 
     if lambda_val is not None and mu_val is not None:
         return (n, k, lambda_val, mu_val)
     return None
 
 
+def _complete_multipartite_parts(G: nx.Graph) -> int | None:
+    """Number of parts if G is complete multipartite, else None."""
+    nodes = list(G.nodes())
+    pos = {v: i for i, v in enumerate(nodes)}
+    full = (1 << len(nodes)) - 1
+    # Bitmask per vertex of its closed non-neighbourhood: the vertices in the
+    # same part, itself included. Non-adjacency is an equivalence relation
+    # (the complement is a union of cliques) iff these parts are disjoint.
+    nbrs = [0] * len(nodes)
+    for u, v in G.edges():
+        nbrs[pos[u]] |= 1 << pos[v]
+        nbrs[pos[v]] |= 1 << pos[u]
+    parts = {full & ~mask for mask in nbrs}
+    if sum(part.bit_count() for part in parts) != len(nodes):
+        return None
+    return len(parts)
+
+
 def _is_line_graph(G: nx.Graph) -> bool:
     """Check if G is a line graph using Beineke's characterization."""
     n = G.number_of_nodes()
     if n <= 1:
         return True
 
-    # Quick check: the claw K_{1,3} is forbidden
-    for v in G.nodes():
-        neighbors = list(G.neighbors(v))
-        if len(neighbors) >= 3:
-            for i in range(len(neighbors)):
-                for j in range(i + 1, len(neighbors)):
-                    for k in range(j + 1, len(neighbors)):
-                        if (not G.has_edge(neighbors[i], neighbors[j]) and
-                            not G.has_edge(neighbors[j], neighbors[k]) and
-                            not G.has_edge(neighbors[i], neighbors[k])):
-                            return False  # Found claw K_{1,3}
+    # Quick check: the claw K_{1,3} is forbidden. v is a claw centre iff
+    # three of its neighbours are pairwise non-adjacent, i.e. the complement
+    # of the graph induced on N(v) has a triangle: (C @ C) * C is nonzero.
+    A = nx.to_numpy_array(G, dtype=np.int64)
+    for row in A:
+        nbrs = np.flatnonzero(row)
+        if len(nbrs) >= 3:
+            C = 1 - A[np.ix_(nbrs, nbrs)]
+            np.fill_diagonal(C, 0)
+            if ((C @ C) * C).any():
+                return False  # Found claw K_{1,3}
 
     try:
         return nx.is_valid_line_graph(G)
@@ -257,7 +265,7 @@ def _is_windmill(G: nx.Graph) -> bool:
     neighbors = set(G.neighbors(universal))
 
     # Remove universal vertex, remaining graph should be disjoint cliques
-    H = G.subgraph([v for v in G.nodes() if v != universal]).copy()
+    H = G.subgraph([v for v in G.nodes() if v != universal])
 
     if not H.nodes():
         return False
@@ -298,28 +306,17 @@ def _is_fan(G: nx.Graph, n: int, m: int) -> bool:
     if m != expected_edges or k < 2:
         return False
 
-    # Try each vertex as potential apex
-    for apex in G.nodes():
-        # Remove apex, check if remaining is a path with all vertices connected to apex
-        other_nodes = [v for v in G.nodes() if v != apex]
-        H = G.subgraph(other_nodes)
-
-        # Path has k vertices and k-1 edges
-        if H.number_of_edges() != k - 1:
-            continue
-
-        # Check it's a path: exactly 2 vertices of degree 1, rest degree 2
-        h_degrees = sorted([d for _, d in H.degree()])
-        if k == 2:
-            expected_path_degrees = [1, 1]
-        else:
-            expected_path_degrees = [1, 1] + [2] * (k - 2)
-
-        if h_degrees != expected_path_degrees:
+    # The apex is adjacent to every path vertex, so only vertices of degree k
+    # are candidates. Removing it lowers every other degree by exactly one and
+    # leaves m - k = k - 1 edges, so the path check needs neither a subgraph
+    # nor per-vertex has_edge lookups.
+    expected_path_degrees = [1, 1] + [2] * (k - 2)
+    degrees = dict(G.degree())
+    for apex, d in degrees.items():
+        if d != k:
             continue
-
-        # Verify all path vertices connected to apex
-        if all(G.has_edge(v, apex) for v in other_nodes):
+        h_degrees = sorted(degrees[v] - 1 for v in degrees if v != apex)
+        if h_degrees == expected_path_degrees:
             return True
 
     return False
@@ -337,20 +334,23 @@ def _is_vertex_transitive(G: nx.Graph) -> bool:
         nodes = list(G.nodes())
         first = nodes[0]
 
-        # Check if every vertex can be mapped to the first vertex
+        # Pin first -> v with node labels so VF2 prunes every partial mapping
+        # that sends first elsewhere, instead of enumerating the whole
+        # automorphism group and filtering afterwards. One unlabelled copy of
+        # G is matched against itself: "src" marks first on the source side,
+        # "dst" marks v on the target side, toggled per v instead of copying.
+        H = nx.Graph(G.edges())
+        H.add_nodes_from(nodes)
+        H.nodes[first]["src"] = True
+
+        def node_match(a, b):
+            return a.get("src", False) == b.get("dst", False)
+
+        # Check if the first vertex can be mapped to every other vertex
         for v in nodes[1:]:
-            # Try to find an automorphism mapping first -> v
-            found = False
-            GM = GraphMatcher(G, G)
-            # Limit number of isomorphisms checked to avoid exponential blowup
-            max_isos_to_check = 10000
-            for i, iso in enumerate(GM.isomorphisms_iter()):
-                if iso[first] == v:
-                    found = True
-                    break
-                if i >= max_isos_to_check:
-                    # Too many automorphisms, give up
-                    return False
+            H.nodes[v]["dst"] = True
+            found = GraphMatcher(H, H, node_match=node_match).is_isomorphic()
+            del H.nodes[v]["dst"]
             if not found:
                 return False
 
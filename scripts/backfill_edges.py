@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Backfill the edges_json column (edge list decoded from graph6).
+
+Only updates rows where edges_json is NULL, so it is safe to re-run.
+
+Usage:
+    uv run python scripts/backfill_edges.py
+    uv run python scripts/backfill_edges.py --max-n 9
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+import psycopg2
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from db.graph_data import edges_from_graph6
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--max-n", type=int, default=None)
+    ap.add_argument("--batch-size", type=int, default=10000)
+    args = ap.parse_args()
+
+    conn = psycopg2.connect(os.environ.get("DATABASE_URL", "dbname=smol"))
+    where_n = "" if args.max_n is None else f" AND n <= {int(args.max_n)}"
+
+    with conn.cursor() as cur:
+        cur.execute(f"SELECT COUNT(*) FROM graphs WHERE edges_json IS NULL{where_n}")
+        total = cur.fetchone()[0]
+    print(f"edges_json: {total:,} graphs to backfill")
+    if total == 0:
+        return
+
+    # Stream the rows through a server-side cursor rather than fetching them
+    # all up front; WITH HOLD keeps it open across the per-batch commits.
+    read = conn.cursor(name="backfill_edges_rows", withhold=True)
+    read.itersize = 10000
+    read.execute(f"SELECT id, graph6 FROM graphs WHERE edges_json IS NULL{where_n}")
+
+    done = 0
+    batch = []
+    write = conn.cursor()
+    rows = (row for block in iter(lambda: read.fetchmany(read.itersize), []) for row in block)
+    for graph_id, g6 in rows:
+        batch.append((json.dumps(edges_from_graph6(g6)), graph_id))
+        if len(batch) >= args.batch_size:
+            write.executemany("UPDATE graphs SET edges_json = %s WHERE id = %s", batch)
+            conn.commit()
+            done += len(batch)
+            print(f"  {done:,}/{total:,}", end="\r", flush=True)
+            batch = []
+    if batch:
+        write.executemany("UPDATE graphs SET edges_json = %s WHERE id = %s", batch)
+        conn.commit()
+        done += len(batch)
+    print(f"  {done:,}/{total:,} done")
+    read.close()
+    conn.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,17 +8,25 @@ touches columns that are already populated.
 Usage:
     uv run python scripts/backfill_matrix.py --matrix non3cyc
     uv run python scripts/backfill_matrix.py --matrix non4cyc --max-n 9
+    uv run python scripts/backfill_matrix.py --matrix non3cyc --workers 8
 """
 
 import argparse
+import multiprocessing as mp
 import os
 import sys
+from contextlib import nullcontext
+from functools import partial
 from pathlib import Path
 
 import psycopg2
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
+from db.parallel import pin_blas_threads
+
+pin_blas_threads()  # before numpy is imported (via db.* / networkx)
+
 import networkx as nx
 
 from db.matrix_types import MATRIX_TYPES, MATRIX_KEYS
@@ -68,6 +76,13 @@ def compute_columns(mt, g6):
     return [eigs.tolist()], h
 
 
+def backfill_row(matrix: str, row: tuple[int, str]) -> tuple:
+    """UPDATE parameters for one (id, graph6) row; runs in a worker process."""
+    graph_id, g6 = row
+    values, h = compute_columns(MATRIX_TYPES[matrix], g6)
+    return (*values, h, graph_id)
+
+
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--matrix", required=True, choices=list(MATRIX_KEYS))
@@ -77,6 +92,9 @@ def main():
     # expensive matrices. Each shard handles rows where id %% num-shards == shard.
     ap.add_argument("--shard", type=int, default=None)
     ap.add_argument("--num-shards", type=int, default=None)
+    # Within one shard (or the whole run), spread the graphs over a process
+    # pool. Defaults to serial so concurrent shards do not oversubscribe.
+    ap.add_argument("--workers", type=int, default=1)
     args = ap.parse_args()
 
     mt = MATRIX_TYPES[args.matrix]
@@ -97,31 +115,43 @@ def main():
     if total == 0:
         return
 
-    with conn.cursor() as read:
-        read.execute(
-            f"SELECT id, graph6 FROM graphs WHERE {mt.hash_column} IS NULL{where_n}"
-        )
-        rows = read.fetchall()
+    # Stream the rows through a server-side cursor rather than fetching them
+    # all up front; WITH HOLD keeps it open across the per-batch commits.
+    read = conn.cursor(name="backfill_rows", withhold=True)
+    read.itersize = 10000
+    read.execute(
+        f"SELECT id, graph6 FROM graphs WHERE {mt.hash_column} IS NULL{where_n}"
+    )
 
     done = 0
     batch = []
     write = conn.cursor()
-    for graph_id, g6 in rows:
-        values, h = compute_columns(mt, g6)
-        batch.append((*values, h, graph_id))
-        if len(batch) >= args.batch_size:
-            write.executemany(
-                f"UPDATE graphs SET {set_clause} WHERE id = %s", batch
-            )
-            conn.commit()
-            done += len(batch)
-            print(f"  {done:,}/{total:,}", end="\r", flush=True)
-            batch = []
+    row_fn = partial(backfill_row, args.matrix)
+    with mp.Pool(args.workers) if args.workers > 1 else nullcontext() as pool:
+        mapper = partial(pool.imap, chunksize=100) if pool else map
+        # Only the parent touches the connection: it fetches blocks of rows
+        # and writes the UPDATE batches while the pool computes spectra.
+        results = (
+            params
+            for rows in iter(lambda: read.fetchmany(read.itersize), [])
+            for params in mapper(row_fn, rows)
+        )
+        for params in results:
+            batch.append(params)
+            if len(batch) >= args.batch_size:
+                write.executemany(
+                    f"UPDATE graphs SET {set_clause} WHERE id = %s", batch
+                )
+                conn.commit()
+                done += len(batch)
+                print(f"  {done:,}/{total:,}", end="\r", flush=True)
+                batch = []
     if batch:
         write.executemany(f"UPDATE graphs SET {set_clause} WHERE id = %s", batch)
         conn.commit()
         done += len(batch)
     print(f"  {done:,}/{total:,} done")
+    read.close()
     conn.close()
 
 
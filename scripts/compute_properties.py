@@ -13,7 +13,7 @@ Properties computed:
 - assortativity: Degree assortativity coefficient (Pearson correlation)
 
 Usage:
-    uv run python scripts/compute_properties.py [--n N] [--batch-size SIZE] [--quiet]
+    uv run python scripts/compute_properties.py [--n N] [--batch-size SIZE] [--workers W] [--quiet]
 
 Notes:
 - Uses WITH HOLD cursor to survive transaction commits during batch processing
@@ -22,6 +22,16 @@ Notes:
 """
 
 import argparse
+import multiprocessing as mp
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from db.parallel import pin_blas_threads
+
+pin_blas_threads()  # before numpy is imported
+
 import psycopg2
 import networkx as nx
 import numpy as np
@@ -103,10 +113,27 @@ def compute_properties(G: nx.Graph) -> dict:
     }
 
 
+def properties_row(row: tuple) -> tuple:
+    """UPDATE parameters for one (id, graph6) row; runs in a worker process."""
+    graph_id, g6 = row
+    props = compute_properties(graph6_to_nx(g6))
+    return (
+        props['clique_number'],
+        props['chromatic_number'],
+        props['algebraic_connectivity'],
+        props['assortativity'],
+        props['global_clustering'],
+        props['avg_local_clustering'],
+        props['avg_path_length'],
+        graph_id
+    )
+
+
 def main():
     parser = argparse.ArgumentParser(description='Compute graph properties')
     parser.add_argument('--n', type=int, help='Only process graphs with this vertex count')
     parser.add_argument('--batch-size', type=int, default=500, help='Batch size for updates')
+    parser.add_argument('--workers', type=int, default=mp.cpu_count(), help='Worker processes')
     parser.add_argument('--quiet', action='store_true', help='Suppress progress output')
     args = parser.parse_args()
 
@@ -131,25 +158,20 @@ def main():
     processed = 0
     batch = []
 
-    with conn.cursor(name='prop_cursor', withhold=True) as cur:
+    # Each graph is independent, so workers compute properties. The parent
+    # alone touches the connection: it fetches a block of rows from the
+    # server-side cursor, maps it over the pool, and writes the batches.
+    with conn.cursor(name='prop_cursor', withhold=True) as cur, mp.Pool(args.workers) as pool:
         cur.itersize = 1000
         cur.execute(f"SELECT id, graph6 FROM graphs {where_clause}")
 
-        for row in cur:
-            graph_id, g6 = row
-            G = graph6_to_nx(g6)
-            props = compute_properties(G)
-
-            batch.append((
-                props['clique_number'],
-                props['chromatic_number'],
-                props['algebraic_connectivity'],
-                props['assortativity'],
-                props['global_clustering'],
-                props['avg_local_clustering'],
-                props['avg_path_length'],
-                graph_id
-            ))
+        results = (
+            params
+            for rows in iter(lambda: cur.fetchmany(cur.itersize), [])
+            for params in pool.imap(properties_row, rows, chunksize=100)
+        )
+        for params in results:
+            batch.append(params)
 
             if len(batch) >= args.batch_size:
                 with conn.cursor() as update_cur:
@@ -9,25 +9,44 @@ After computation, tags will be either:
 Usage:
     python scripts/compute_tags.py [--batch-size 1000]
     python scripts/compute_tags.py --recompute  # Recompute all tags
+    python scripts/compute_tags.py --workers 8
 """
 
 import argparse
+import multiprocessing as mp
 import os
 import sys
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from db.parallel import pin_blas_threads
+
+pin_blas_threads()  # before numpy is imported (via db.* / networkx)
+
 import networkx as nx
 import psycopg2
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from db.tags import compute_tags
 
 DATABASE_URL = os.environ.get("DATABASE_URL", "dbname=smol")
 
 
+def tags_for_row(row: tuple[int, str]) -> tuple[list[str], int]:
+    """Compute (tags, id) for one (id, graph6) row; runs in a worker process."""
+    graph_id, graph6 = row
+    G = nx.from_graph6_bytes(graph6.encode())
+    return compute_tags(G), graph_id
+
+
 def main():
     parser = argparse.ArgumentParser(description="Compute tags for graphs")
     parser.add_argument("--batch-size", type=int, default=1000, help="Batch size for updates")
     parser.add_argument("--recompute", action="store_true", help="Recompute all tags, not just empty ones")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=mp.cpu_count(),
+        help="Worker processes (default: one per CPU; pass 1 to tag in a single process)",
+    )
     args = parser.parse_args()
 
     conn = psycopg2.connect(DATABASE_URL)
@@ -42,33 +61,35 @@ def main():
     action = "Recomputing" if args.recompute else "Computing"
     print(f"{action} tags for {total:,} graphs...")
 
-    # Fetch graphs in batches
-    if args.recompute:
-        cur.execute("SELECT id, graph6 FROM graphs ORDER BY id")
-    else:
-        cur.execute(
-            """
-            SELECT id, graph6
-            FROM graphs
-            WHERE tags IS NULL
-            ORDER BY id
-            """
-        )
+    query = "SELECT id, graph6 FROM graphs"
+    if not args.recompute:
+        query += " WHERE tags IS NULL"
+    query += " ORDER BY id"
 
     updates = []
     count = 0
 
-    for graph_id, graph6 in cur:
-        G = nx.from_graph6_bytes(graph6.encode())
-        tags = compute_tags(G)
-
-        updates.append((tags, graph_id))
-
-        if len(updates) >= args.batch_size:
-            update_batch(conn, updates)
-            count += len(updates)
-            print(f"  {count:,}/{total:,} ({100*count/total:.1f}%)")
-            updates = []
+    # Tagging is per-graph and CPU-bound, so fan it out across processes.
+    # The parent alone touches the connection: it fetches a block of rows
+    # from the server-side cursor (WITH HOLD, so it survives the batch
+    # commits), maps it over the pool, and writes the UPDATE batches.
+    with conn.cursor(name="tags_cursor", withhold=True) as read, mp.Pool(args.workers) as pool:
+        read.itersize = 1000
+        read.execute(query)
+
+        results = (
+            result
+            for rows in iter(lambda: read.fetchmany(read.itersize), [])
+            for result in pool.imap(tags_for_row, rows, chunksize=100)
+        )
+        for result in results:
+            updates.append(result)
+
+            if len(updates) >= args.batch_size:
+                update_batch(conn, updates)
+                count += len(updates)
+                print(f"  {count:,}/{total:,} ({100*count/total:.1f}%)")
+                updates = []
 
     if updates:
         update_batch(conn, updates)
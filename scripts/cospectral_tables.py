@@ -37,20 +37,21 @@ def table1(conn, max_n: int) -> dict:
     )
     totals = {r[0]: r[1] for r in cur.fetchall()}
 
-    # Cospectral counts by matrix type: sum of family sizes per n.
-    results = {}
-    for matrix in MATRIX_KEYS:
-        cur.execute(
-            """
-            SELECT n, COALESCE(SUM(family_size), 0)
-            FROM cospectral_families
-            WHERE matrix_type = %s AND n <= %s
-            GROUP BY n
-            ORDER BY n
-            """,
-            (matrix, max_n),
-        )
-        results[matrix] = {r[0]: r[1] for r in cur.fetchall()}
+    # Cospectral counts by matrix type: sum of family sizes per n, for every
+    # matrix type in one round trip.
+    results = {matrix: {} for matrix in MATRIX_KEYS}
+    cur.execute(
+        """
+        SELECT matrix_type, n, COALESCE(SUM(family_size), 0)
+        FROM cospectral_families
+        WHERE matrix_type = ANY(%s) AND n <= %s
+        GROUP BY matrix_type, n
+        ORDER BY matrix_type, n
+        """,
+        (list(MATRIX_KEYS), max_n),
+    )
+    for matrix, n, count in cur.fetchall():
+        results[matrix][n] = count
 
     return {"totals": totals, "cospectral": results}
 
@@ -71,26 +72,29 @@ def table2(conn, max_n: int) -> dict:
     # Cospectral counts by matrix type, restricted to md2 graphs cospectral with
     # ANOTHER md2 graph: within each family, count members with min_degree >= 2 and
     # keep only families where at least two such members remain.
-    results = {}
-    for matrix in MATRIX_KEYS:
-        hash_col = f"{matrix}_spectral_hash"
-        cur.execute(
-            f"""
-            WITH md2_fam AS (
-                SELECT g.n AS n, COUNT(*) AS c
-                FROM graphs g
-                JOIN cospectral_families cf
-                  ON cf.matrix_type = %s AND cf.n = g.n
-                 AND cf.spectral_hash = g.{hash_col}
-                WHERE g.min_degree >= 2 AND g.n <= %s
-                GROUP BY g.n, g.{hash_col}
-                HAVING COUNT(*) > 1
-            )
-            SELECT n, SUM(c) FROM md2_fam GROUP BY n ORDER BY n
-            """,
-            (matrix, max_n),
-        )
-        results[matrix] = {r[0]: r[1] for r in cur.fetchall()}
+    # Each matrix type joins on its own hash column, so the per-type queries
+    # are combined with UNION ALL and sent as one statement.
+    per_matrix = [
+        f"""
+        SELECT %s AS matrix_type, n, SUM(c) FROM (
+            SELECT g.n AS n, COUNT(*) AS c
+            FROM graphs g
+            JOIN cospectral_families cf
+              ON cf.matrix_type = %s AND cf.n = g.n
+             AND cf.spectral_hash = g.{matrix}_spectral_hash
+            WHERE g.min_degree >= 2 AND g.n <= %s
+            GROUP BY g.n, g.{matrix}_spectral_hash
+            HAVING COUNT(*) > 1
+        ) md2_fam GROUP BY n
+        """
+        for matrix in MATRIX_KEYS
+    ]
+    params = [p for matrix in MATRIX_KEYS for p in (matrix, matrix, max_n)]
+    cur.execute(" UNION ALL ".join(per_matrix), params)
+
+    results = {matrix: {} for matrix in MATRIX_KEYS}
+    for matrix, n, count in cur.fetchall():
+        results[matrix][n] = count
 
     return {"totals": totals, "cospectral": results}
 
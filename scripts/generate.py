@@ -17,6 +17,8 @@ Features:
 """
 
 import argparse
+import csv
+import io
 import multiprocessing as mp
 import subprocess
 import sys
@@ -25,6 +27,10 @@ from typing import Iterator
 
 sys.path.insert(0, str(__file__).rsplit("/", 2)[0])
 
+from db.parallel import pin_blas_threads
+
+pin_blas_threads()  # before numpy is imported (via db.* / networkx)
+
 from db.graph_data import process_graph, graph_from_graph6, INSERT_COLUMNS
 from db.database import connect, init_schema
 
@@ -61,17 +67,24 @@ def generate_graphs(n: int, m: int | None = None, connected: bool = False) -> It
 
 def get_existing_graphs(conn, n: int) -> set[str]:
     """Get set of graph6 strings already in database for given n."""
-    with conn.cursor() as cur:
+    # Server-side cursor: stream rows into the set instead of materializing
+    # the full result list alongside it (millions of rows at n=10).
+    with conn.cursor(name="existing_graphs") as cur:
+        cur.itersize = 10000
         cur.execute("SELECT graph6 FROM graphs WHERE n = %s", (n,))
-        return {row[0] for row in cur.fetchall()}
+        return {row[0] for row in cur}
+
 
+def process_single_graph(graph6_str: str) -> str | None:
+    """Process a single graph and return its record as a COPY csv line.
 
-def process_single_graph(graph6_str: str) -> dict | None:
-    """Process a single graph and return its record as a dict."""
+    Formatting happens here, in the worker, so the parent only concatenates
+    lines: it never unpickles or re-formats the per-eigenvalue float lists.
+    """
     try:
         G = graph_from_graph6(graph6_str)
         record = process_graph(G, graph6_str)
-        return record.to_db_tuple()
+        return _copy_line(record.to_db_tuple())
     except Exception as e:
         print(f"\nError processing {graph6_str}: {e}", file=sys.stderr)
         return None
@@ -164,7 +177,7 @@ def process_and_insert(
 
             if len(batch) >= batch_size:
                 if not dry_run:
-                    insert_batch_tuples(conn, batch)
+                    insert_batch_rows(conn, batch)
                 batch = []
 
                 if verbose:
@@ -183,7 +196,7 @@ def process_and_insert(
 
     # Insert remaining batch
     if batch and not dry_run:
-        insert_batch_tuples(conn, batch)
+        insert_batch_rows(conn, batch)
 
     if verbose:
         elapsed = time.time() - start_time
@@ -199,20 +212,43 @@ def process_and_insert(
     return total
 
 
-def insert_batch_tuples(conn, tuples: list[tuple]) -> int:
-    """Insert a batch of tuples directly into the database."""
-    if not tuples:
-        return 0
+def _copy_value(value):
+    """A to_db_tuple() value as a COPY csv field (lists become array literals)."""
+    if isinstance(value, list):
+        return "{" + ",".join(map(repr, value)) + "}"
+    return value
+
 
-    from psycopg2.extras import execute_values
+def _copy_line(row: tuple) -> str:
+    """A to_db_tuple() row as one COPY csv line."""
+    buf = io.StringIO()
+    csv.writer(buf).writerow([_copy_value(v) for v in row])
+    return buf.getvalue()
 
-    sql = f"""
-    INSERT INTO graphs ({", ".join(INSERT_COLUMNS)}) VALUES %s
-    ON CONFLICT (graph6) DO NOTHING
+
+def insert_batch_rows(conn, rows: list[str]) -> int:
+    """Insert a batch of COPY csv lines (see _copy_line) into the database.
+
+    The batch is COPYed into a temp staging table and moved into graphs with
+    one INSERT ... SELECT, so existing graph6 rows are still skipped (COPY
+    itself has no ON CONFLICT).
     """
+    if not rows:
+        return 0
+
+    columns = ", ".join(INSERT_COLUMNS)
+    buf = io.StringIO("".join(rows))
 
     with conn.cursor() as cur:
-        execute_values(cur, sql, tuples)
+        cur.execute(
+            f"CREATE TEMP TABLE graphs_stage ON COMMIT DROP AS "
+            f"SELECT {columns} FROM graphs WITH NO DATA"
+        )
+        cur.copy_expert(f"COPY graphs_stage ({columns}) FROM STDIN WITH (FORMAT csv)", buf)
+        cur.execute(
+            f"INSERT INTO graphs ({columns}) SELECT {columns} FROM graphs_stage "
+            f"ON CONFLICT (graph6) DO NOTHING"
+        )
         inserted = cur.rowcount
 
     conn.commit()
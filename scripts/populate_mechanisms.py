@@ -128,16 +128,24 @@ def redetect_and_populate(conn, mechanism, n, matrix_type='adj'):
 
     cur = conn.cursor()
 
-    # Get all cospectral pairs (generated from same-hash families via a self-join).
+    # Get all cospectral pairs: group the n-vertex graphs by hash once and
+    # expand each family of size k into its C(k,2) pairs, instead of
+    # self-joining graphs on the hash and filtering the k^2 matches.
     hash_col = f"{matrix_type}_spectral_hash"
     cur.execute(f"""
-        SELECT g1.id, g2.id, g1.graph6, g2.graph6
-        FROM graphs g1
-        JOIN graphs g2
-          ON g1.n = g2.n
-         AND g1.{hash_col} = g2.{hash_col}
-         AND g1.id < g2.id
-        WHERE g1.n = %s AND g1.{hash_col} IS NOT NULL
+        WITH fam AS (
+            SELECT array_agg(id ORDER BY id) AS ids,
+                   array_agg(graph6 ORDER BY id) AS g6s
+            FROM graphs
+            WHERE n = %s AND {hash_col} IS NOT NULL
+            GROUP BY {hash_col}
+            HAVING COUNT(*) > 1
+        )
+        SELECT ids[i], ids[j], g6s[i], g6s[j]
+        FROM fam,
+             generate_subscripts(ids, 1) AS i,
+             generate_subscripts(ids, 1) AS j
+        WHERE i < j
     """, (n,))
 
     pairs = cur.fetchall()
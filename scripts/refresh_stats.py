@@ -48,39 +48,42 @@ def compute_stats(conn) -> dict:
     # Cospectral counts from the families table. A graph is "not determined by its
     # spectrum" iff its (n, hash) is a family of size >= 2; "all graphs" count is the
     # sum of family sizes per n.
-    cospectral = {}
-    for matrix in MATRIX_KEYS:
-        cur.execute(
-            """
-            SELECT n, COALESCE(SUM(family_size), 0)
-            FROM cospectral_families
-            WHERE matrix_type = %s AND n <= %s
-            GROUP BY n
-            ORDER BY n
-            """,
-            (matrix, MAX_N),
-        )
-        cospectral[matrix] = {str(r[0]): r[1] for r in cur.fetchall()}
+    cospectral = {matrix: {} for matrix in MATRIX_KEYS}
+    cur.execute(
+        """
+        SELECT matrix_type, n, COALESCE(SUM(family_size), 0)
+        FROM cospectral_families
+        WHERE matrix_type = ANY(%s) AND n <= %s
+        GROUP BY matrix_type, n
+        ORDER BY matrix_type, n
+        """,
+        (list(MATRIX_KEYS), MAX_N),
+    )
+    for matrix, n, count in cur.fetchall():
+        cospectral[matrix][str(n)] = count
 
     # Cospectral counts for min_degree >= 2: md2 graphs belonging to a family of
-    # size >= 2 (the family may include graphs of lower degree).
-    cospectral_mindeg2 = {}
-    for matrix in MATRIX_KEYS:
-        hash_col = f"{matrix}_spectral_hash"
-        cur.execute(
-            f"""
-            SELECT g.n, COUNT(*) as cospectral_count
-            FROM graphs g
-            JOIN cospectral_families cf
-              ON cf.matrix_type = %s AND cf.n = g.n
-             AND cf.spectral_hash = g.{hash_col}
-            WHERE g.min_degree >= 2 AND g.n <= %s
-            GROUP BY g.n
-            ORDER BY g.n
-            """,
-            (matrix, MAX_N),
-        )
-        cospectral_mindeg2[matrix] = {str(r[0]): r[1] for r in cur.fetchall()}
+    # size >= 2 (the family may include graphs of lower degree). Each matrix type
+    # joins on its own hash column; UNION ALL sends them as one statement.
+    per_matrix = [
+        f"""
+        SELECT %s AS matrix_type, g.n, COUNT(*) as cospectral_count
+        FROM graphs g
+        JOIN cospectral_families cf
+          ON cf.matrix_type = %s AND cf.n = g.n
+         AND cf.spectral_hash = g.{matrix}_spectral_hash
+        WHERE g.min_degree >= 2 AND g.n <= %s
+        GROUP BY g.n
+        """
+        for matrix in MATRIX_KEYS
+    ]
+    cur.execute(
+        " UNION ALL ".join(per_matrix),
+        [p for matrix in MATRIX_KEYS for p in (matrix, matrix, MAX_N)],
+    )
+    cospectral_mindeg2 = {matrix: {} for matrix in MATRIX_KEYS}
+    for matrix, n, count in cur.fetchall():
+        cospectral_mindeg2[matrix][str(n)] = count
 
     # Tag counts
     cur.execute(
@@ -157,27 +160,24 @@ def compute_stats(conn) -> dict:
     # Property value distributions (only if enough data)
     property_ranges = {}
     if row[1] > 1000:  # Only compute if we have enough data
-        for prop, col in [
+        ranged = [
             ("clustering", "global_clustering"),
             ("assortativity", "assortativity"),
             ("path_length", "avg_path_length"),
-        ]:
-            cur.execute(
-                f"""
-                SELECT
-                    MIN({col})::float,
-                    MAX({col})::float,
-                    AVG({col})::float
-                FROM graphs
-                WHERE {col} IS NOT NULL AND n <= {MAX_N}
-                """
-            )
-            r = cur.fetchone()
-            if r[0] is not None:
+        ]
+        # One scan for all three columns (aggregates skip NULLs per column).
+        aggregates = ", ".join(
+            f"MIN({col})::float, MAX({col})::float, AVG({col})::float" for _, col in ranged
+        )
+        cur.execute(f"SELECT {aggregates} FROM graphs WHERE n <= {MAX_N}")
+        r = cur.fetchone()
+        for i, (prop, _) in enumerate(ranged):
+            lo, hi, avg = r[3 * i: 3 * i + 3]
+            if lo is not None:
                 property_ranges[prop] = {
-                    "min": round(r[0], 4),
-                    "max": round(r[1], 4),
-                    "avg": round(r[2], 4),
+                    "min": round(lo, 4),
+                    "max": round(hi, 4),
+                    "avg": round(avg, 4),
                 }
 
     # Property distributions (histograms for integer properties)
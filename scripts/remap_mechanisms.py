@@ -19,12 +19,12 @@ Usage:
 """
 
 import argparse
-import json
+import csv
+import io
 import sqlite3
 import sys
 
 import psycopg2
-from psycopg2.extras import execute_values, Json
 
 
 def main():
@@ -36,10 +36,6 @@ def main():
     sl = sqlite3.connect(args.sqlite)
     pg = psycopg2.connect(args.pg)
 
-    with pg.cursor() as cur:
-        cur.execute("SELECT graph6, id FROM graphs")
-        g6_to_id = dict(cur.fetchall())
-
     rows = sl.execute(
         """
         SELECT g1.graph6, g2.graph6, sm.matrix_type, sm.mechanism_type, sm.config
@@ -49,29 +45,45 @@ def main():
         """
     ).fetchall()
 
-    out = []
-    missing = 0
-    for g6a, g6b, matrix_type, mechanism_type, config in rows:
-        ia, ib = g6_to_id.get(g6a), g6_to_id.get(g6b)
-        if ia is None or ib is None:
-            missing += 1
-            continue
-        g1, g2 = (ia, ib) if ia < ib else (ib, ia)
-        out.append((g1, g2, matrix_type, mechanism_type, Json(json.loads(config))))
+    # Resolve graph6 -> local id inside Postgres: stage the snapshot rows in a
+    # temp table and join it against graphs (indexed on graph6), instead of
+    # pulling every graph's (graph6, id) into a Python dict.
+    buf = io.StringIO()
+    csv.writer(buf).writerows(rows)
+    buf.seek(0)
 
     with pg.cursor() as cur:
+        cur.execute(
+            """
+            CREATE TEMP TABLE snapshot_mechanisms (
+                graph6_a TEXT, graph6_b TEXT,
+                matrix_type TEXT, mechanism_type TEXT, config JSONB
+            ) ON COMMIT DROP
+            """
+        )
+        cur.copy_expert("COPY snapshot_mechanisms FROM STDIN WITH (FORMAT csv)", buf)
         cur.execute("TRUNCATE switching_mechanisms")
-        execute_values(
-            cur,
+        cur.execute(
             """
             INSERT INTO switching_mechanisms
                 (graph1_id, graph2_id, matrix_type, mechanism_type, config)
-            VALUES %s ON CONFLICT DO NOTHING
-            """,
-            out,
-            page_size=5000,
+            SELECT LEAST(ga.id, gb.id), GREATEST(ga.id, gb.id),
+                   s.matrix_type, s.mechanism_type, s.config
+            FROM snapshot_mechanisms s
+            JOIN graphs ga ON ga.graph6 = s.graph6_a
+            JOIN graphs gb ON gb.graph6 = s.graph6_b
+            ON CONFLICT DO NOTHING
+            """
         )
         inserted = cur.rowcount
+        cur.execute(
+            """
+            SELECT COUNT(*) FROM snapshot_mechanisms s
+            WHERE NOT EXISTS (SELECT 1 FROM graphs g WHERE g.graph6 = s.graph6_a)
+               OR NOT EXISTS (SELECT 1 FROM graphs g WHERE g.graph6 = s.graph6_b)
+            """
+        )
+        missing = cur.fetchone()[0]
     pg.commit()
 
     with pg.cursor() as cur:
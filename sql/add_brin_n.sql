@@ -0,0 +1,17 @@
+-- Replace the B-tree on graphs(n) with a BRIN index.
+--
+-- generate.py loads graphs one n at a time, so n follows physical row order and
+-- a BRIN index (a few pages) prunes whole block ranges for WHERE n = ... scans.
+-- Equality lookups are also served by idx_graphs_n_m, whose leading column is n,
+-- so the standalone B-tree (millions of entries) only costs space and vacuum time.
+--
+-- graphs is not partitioned by n: a partitioned table needs n in every unique
+-- constraint, which would break the id primary key that switching_mechanisms
+-- references and the ON CONFLICT (graph6) upsert in generate.py.
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_graphs_n_brin ON graphs USING BRIN(n);
+DROP INDEX IF EXISTS idx_graphs_n;
+
+COMMIT;
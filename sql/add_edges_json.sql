@@ -0,0 +1,9 @@
+-- Store each graph's edge list, decoded from graph6 once at ingestion, so the
+-- API serves /graph/{g6} edges straight from the row instead of decoding graph6
+-- per request. Format: [[u, v], ...] with u < v, ordered by u then v (the order
+-- the API has always returned edges in).
+--
+-- New rows are populated by scripts/generate.py. Backfill existing rows with:
+--   uv run python scripts/backfill_edges.py
+
+ALTER TABLE graphs ADD COLUMN IF NOT EXISTS edges_json JSONB;
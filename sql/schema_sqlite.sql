@@ -8,6 +8,7 @@ CREATE TABLE IF NOT EXISTS graphs (
     n                   INTEGER NOT NULL,
     m                   INTEGER NOT NULL,
     graph6              TEXT NOT NULL UNIQUE,
+    edges_json          TEXT,  -- JSON [[u, v], ...] decoded from graph6 at ingestion
 
     adj_spectral_hash       TEXT NOT NULL,
     kirchhoff_spectral_hash TEXT NOT NULL,
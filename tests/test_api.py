@@ -1,9 +1,24 @@
 """Tests for the API endpoints."""
 
+import asyncio
+import json
+
 import pytest
+from fastapi.encoders import jsonable_encoder
 from fastapi.testclient import TestClient
 
-from api.main import app
+from api.main import (
+    GRAPH_SUMMARY_LIST,
+    app,
+    comparison_tags,
+    hashes_from_row,
+    json_response,
+    row_to_graph_full,
+    row_to_graph_summary,
+    viz_eigenvalues,
+)
+from api.models import GraphFull, GraphSummary
+from db.matrix_types import MATRIX_KEYS
 
 client = TestClient(app)
 
@@ -323,6 +338,32 @@ class TestAboutEndpoint:
         assert data["message"] == "About page - use HTML request"
 
 
+class TestStatsCache:
+    def test_stats_cached_within_ttl(self, monkeypatch):
+        """Repeated /stats requests within the TTL hit get_stats once."""
+        import api.main
+
+        calls = []
+
+        async def fake_get_stats():
+            calls.append(1)
+            return {
+                "total_graphs": 3,
+                "connected_graphs": 2,
+                "counts_by_n": {1: 1, 2: 1},
+                "cospectral_counts": {},
+            }
+
+        monkeypatch.setattr(api.main, "get_stats", fake_get_stats)
+        monkeypatch.setattr(api.main, "_stats_cache", None)
+        first = client.get("/stats")
+        second = client.get("/stats")
+        assert first.json() == second.json()
+        assert first.json()["total_graphs"] == 3
+        assert len(calls) == 1
+        assert "max-age=" in first.headers["cache-control"]
+
+
 @needs_db
 class TestStatsEndpoint:
     def test_stats_returns_json(self):
@@ -1488,3 +1529,160 @@ class TestCospectralFamiliesEndpoint:
         )
         assert response.status_code == 308
         assert response.headers["location"] == "/cospectral-families?matrix=adj&n=8&limit=2"
+
+
+def _fake_row(graph6: str = "D?{", n: int = 5, m: int = 4) -> dict:
+    """A graphs row as returned by fetch_graph, with every hash set."""
+    row = {
+        "graph6": graph6, "n": n, "m": m,
+        "is_bipartite": True, "is_planar": True, "is_regular": False,
+        "diameter": 2, "girth": None, "radius": 1,
+        "min_degree": 1, "max_degree": 4, "triangle_count": 0,
+        "clique_number": None, "chromatic_number": None,
+        "algebraic_connectivity": None, "global_clustering": None,
+        "avg_local_clustering": None, "avg_path_length": None, "assortativity": None,
+        "tags": ["star"],
+    }
+    for key in MATRIX_KEYS:
+        row[f"{key}_spectral_hash"] = f"{key}-hash"
+    return row
+
+
+class TestRowConversion:
+    """Row -> model converters (no database needed)."""
+
+    def test_graph_full_edges(self):
+        graph = row_to_graph_full(_fake_row(), {k: [] for k in MATRIX_KEYS})
+        assert sorted(graph.edges) == [(0, 4), (1, 4), (2, 4), (3, 4)]
+        assert graph.tags == ["star"]
+
+    def test_missing_property_column_raises(self):
+        row = _fake_row()
+        del row["diameter"]
+        with pytest.raises(KeyError, match="diameter"):
+            row_to_graph_summary(row)
+        # The distributions are never selected by the graph queries.
+        assert row_to_graph_summary(_fake_row()).properties.betweenness_centrality is None
+
+    def test_hashes_from_row(self):
+        row = _fake_row() | {"dist_spectral_hash": None}
+        hashes = hashes_from_row(row)
+        assert list(hashes) == list(MATRIX_KEYS)
+        assert hashes["adj"] == "adj-hash"
+        assert hashes["dist"] == ""
+
+    def test_comparison_tags(self):
+        mates = {k: [] for k in MATRIX_KEYS}
+        tagged = row_to_graph_full(_fake_row() | {"tags": ["bipartite", "planar", "star"]}, mates)
+        assert comparison_tags(tagged) == {"bipartite", "planar", "star"}
+        # Tags not computed yet: fall back to the structural booleans.
+        untagged = row_to_graph_full(_fake_row() | {"tags": []}, mates)
+        assert comparison_tags(untagged) == {"bipartite", "planar"}
+        # Stored tags from an older run that lack a property tag: still unioned.
+        partial = row_to_graph_full(_fake_row() | {"tags": ["star"]}, mates)
+        assert comparison_tags(partial) == {"bipartite", "planar", "star"}
+
+    def test_viz_eigenvalues_memoized_by_graph6(self):
+        first = viz_eigenvalues("D?{")
+        assert viz_eigenvalues("D?{") is first
+        assert len(first["adj_eigenvalues"]) == 5
+
+    def test_eigenvalues_endpoint_invalid_graph6_not_cached(self):
+        assert client.get("/api/graph/%21%21/eigenvalues").status_code == 400
+        assert client.get("/api/graph/%21%21/eigenvalues").status_code == 400
+
+    def test_graph_full_prefers_stored_edges_json(self):
+        row = _fake_row("D?{") | {"edges_json": [[0, 4], [1, 4], [2, 4], [3, 4]]}
+        mates = {k: [] for k in MATRIX_KEYS}
+        stored = row_to_graph_full(row, mates)
+        decoded = row_to_graph_full(_fake_row("D?{"), mates)
+        assert stored.edges == [(0, 4), (1, 4), (2, 4), (3, 4)]
+        assert stored.model_dump_json() == decoded.model_dump_json()
+
+    def test_graph_full_reflects_backfilled_columns(self):
+        """Tags/properties updated in place must show up on the next request."""
+        mates = {k: [] for k in MATRIX_KEYS}
+        first = row_to_graph_full(_fake_row(), mates)
+        later = row_to_graph_full(_fake_row() | {"tags": ["star", "tree"], "diameter": 3}, mates)
+        assert later is not first
+        assert later.tags == ["star", "tree"]
+        assert later.properties.diameter == 3
+
+    def test_constructed_models_are_valid(self):
+        """Models built without validation must still pass validation."""
+        graph = row_to_graph_full(_fake_row(), {k: [] for k in MATRIX_KEYS})
+        assert GraphFull.model_validate(graph.model_dump()).model_dump() == graph.model_dump()
+        summary = row_to_graph_summary(_fake_row())
+        assert GraphSummary.model_validate(summary.model_dump()).model_dump() == summary.model_dump()
+
+    def test_json_response_matches_default_encoding(self):
+        """Pydantic-serialized bodies must match FastAPI's default encoding."""
+        graph = row_to_graph_full(_fake_row(), {k: [] for k in MATRIX_KEYS})
+        summary = row_to_graph_summary(_fake_row())
+        response = json_response(graph.model_dump_json())
+        assert response.headers["content-type"] == "application/json"
+        assert json.loads(response.body) == jsonable_encoder(graph)
+        body = GRAPH_SUMMARY_LIST.dump_json([summary])
+        assert json.loads(body) == jsonable_encoder([summary])
+
+    def test_graph_summary_reflects_backfilled_columns(self):
+        first = row_to_graph_summary(_fake_row())
+        assert first.properties.max_degree == 4
+        later = row_to_graph_summary(_fake_row() | {"tags": ["tree"], "max_degree": 3})
+        assert later is not first
+        assert later.tags == ["tree"]
+        assert later.properties.max_degree == 3
+
+
+class TestPgPoolCheckout:
+    """Dead pooled PostgreSQL connections are discarded, not handed out again."""
+
+    class _Conn:
+        def __init__(self, closed=0):
+            self.closed = closed
+
+    class _Pool:
+        maxconn = 8
+
+        def __init__(self, conns):
+            self.conns, self.returned = list(conns), []
+
+        def getconn(self):
+            if not self.conns:
+                from psycopg2.pool import PoolError
+                raise PoolError("connection pool exhausted")
+            return self.conns.pop(0)
+
+        def putconn(self, conn, close=False):
+            self.returned.append((conn, close))
+
+    def test_skips_closed_connections(self):
+        from api.database import _checkout_pg
+        reaped, live = self._Conn(closed=1), self._Conn()
+        pool = self._Pool([reaped, live])
+        assert _checkout_pg(pool) is live
+        assert pool.returned == [(reaped, True)]
+
+    def test_exhausted_pool_returns_none(self):
+        from api.database import _checkout_pg
+        pool = self._Pool([self._Conn(closed=2)])
+        assert _checkout_pg(pool) is None
+
+    def test_connection_failing_mid_request_is_discarded(self, monkeypatch):
+        import psycopg2
+        import api.database
+
+        ok, dead = self._Conn(), self._Conn()
+        pool = self._Pool([ok, dead])
+        monkeypatch.setattr(api.database, "IS_SQLITE", False)
+        monkeypatch.setattr(api.database, "_get_pg_pool", lambda: pool)
+
+        async def use(fail):
+            async with api.database.get_db():
+                if fail:
+                    raise psycopg2.OperationalError("server closed the connection")
+
+        asyncio.run(use(False))
+        with pytest.raises(psycopg2.OperationalError):
+            asyncio.run(use(True))
+        assert pool.returned == [(ok, False), (dead, True)]
@@ -1,8 +1,16 @@
 """Tests for graph data processing."""
 
+import json
+
 import networkx as nx
 
-from db.graph_data import process_graph, graph_from_graph6, GraphRecord, INSERT_COLUMNS
+from db.graph_data import (
+    process_graph,
+    graph_from_graph6,
+    edges_from_graph6,
+    GraphRecord,
+    INSERT_COLUMNS,
+)
 
 
 def test_graph_from_graph6_path():
@@ -25,6 +33,25 @@ def test_graph_from_graph6_complete():
     assert G.number_of_edges() == 6
 
 
+def test_edges_from_graph6_matches_networkx():
+    """Direct graph6 decoding should give the same edges as NetworkX."""
+    graphs = [
+        nx.empty_graph(1),
+        nx.path_graph(4),
+        nx.complete_graph(5),
+        nx.petersen_graph(),
+        nx.gnp_random_graph(10, 0.4, seed=1),
+        nx.gnp_random_graph(70, 0.1, seed=2),  # n >= 63 uses the long size prefix
+    ]
+    for G in graphs:
+        g6 = nx.to_graph6_bytes(G, header=False).decode("ascii").strip()
+        expected = [tuple(sorted(e)) for e in graph_from_graph6(g6).edges()]
+        edges = edges_from_graph6(g6)
+        assert edges == expected  # same order, not just the same set
+        assert all(u < v for u, v in edges)
+    assert edges_from_graph6("CN") == [(0, 3), (1, 2), (1, 3), (2, 3)]
+
+
 def test_process_graph_returns_record():
     """process_graph should return a GraphRecord."""
     G = nx.path_graph(4)
@@ -102,6 +129,53 @@ def test_process_graph_complete():
     assert record.triangle_count == 4  # C(4,3) = 4 triangles
 
 
+def test_planarity_edge_bounds_match_lr_test():
+    """The edge-count shortcuts agree with the full planarity test."""
+    from db.metadata import compute_metadata
+
+    graphs = [
+        nx.complete_graph(5),  # m = 10 > 3n - 6
+        nx.complete_bipartite_graph(3, 3),  # bipartite, m = 9 > 2n - 4
+        nx.petersen_graph(),  # within both bounds, non-planar
+        nx.icosahedral_graph(),  # m = 3n - 6, planar
+        nx.cubical_graph(),  # bipartite, m = 2n - 4, planar
+    ]
+    for G in graphs:
+        assert compute_metadata(G)["is_planar"] is nx.check_planarity(G)[0]
+
+
+def test_metadata_eccentricities():
+    """Diameter/radius from the hop-distance matrix; None when disconnected."""
+    from db.matrices import distance_matrix
+    from db.metadata import compute_metadata
+
+    G = nx.path_graph(5)
+    for meta in (compute_metadata(G), compute_metadata(G, distance_matrix(G))):
+        assert meta["diameter"] == 4
+        assert meta["radius"] == 2
+    meta = compute_metadata(nx.disjoint_union(nx.path_graph(3), nx.path_graph(2)))
+    assert meta["diameter"] is None
+    assert meta["radius"] is None
+
+
+def test_forest_nb_spectra_match_eigensolve():
+    """The forest shortcut gives exactly the eigensolver's NB/NBL spectra."""
+    from db.graph_data import _nb_spectra
+    from db.matrices import nonbacktracking_laplacian, nonbacktracking_matrix
+    from db.spectrum import compute_complex_eigenvalues, spectral_hash_complex
+
+    forests = list(nx.nonisomorphic_trees(7))
+    forests.append(nx.disjoint_union(nx.path_graph(4), nx.star_graph(3)))
+    for G in forests:
+        B = nonbacktracking_matrix(G)
+        expected = (
+            compute_complex_eigenvalues(B),
+            compute_complex_eigenvalues(nonbacktracking_laplacian(G, B)),
+        )
+        for got, want in zip(_nb_spectra(G), expected):
+            assert spectral_hash_complex(got) == spectral_hash_complex(want)
+
+
 def test_process_graph_star():
     """Check metadata for star graph (tree)."""
     G = nx.star_graph(4)  # 5 vertices: 1 center + 4 leaves
@@ -128,9 +202,18 @@ def test_to_db_tuple():
 
     assert isinstance(tup, tuple)
     # Value order/length must match the shared INSERT column list exactly.
-    assert len(tup) == len(INSERT_COLUMNS) == 47
+    assert len(tup) == len(INSERT_COLUMNS) == 48
     assert tup[0] == 3  # n
     assert tup[1] == 2  # m
+    assert json.loads(tup[INSERT_COLUMNS.index("edges_json")]) == [[0, 1], [1, 2]]
+
+
+def test_edges_json_matches_api_edge_order():
+    """edges_json stores the u-major order the API serves, not graph6 bit order."""
+    G = graph_from_graph6("CN")
+    record = process_graph(G, "CN")
+    expected = [list(sorted(e)) for e in G.edges()]
+    assert json.loads(record.edges_json) == expected == [[0, 3], [1, 2], [1, 3], [2, 3]]
 
 
 def test_dist_spectrum_connected_vs_disconnected():
@@ -382,6 +382,22 @@ def test_nonbacktracking_matrix_k3():
     assert B.sum() == 6  # Each directed edge has 1 continuation
 
 
+def test_nonbacktracking_matrix_matches_definition():
+    """B[(u,v),(w,x)] = 1 iff v == w and x != u, for non-contiguous labels too."""
+    graphs = [
+        nx.petersen_graph(),
+        nx.gnp_random_graph(9, 0.4, seed=1),
+        nx.relabel_nodes(nx.wheel_graph(6), {i: 3 * i + 2 for i in range(6)}),
+    ]
+    for G in graphs:
+        B = nonbacktracking_matrix(G)
+        edges = sorted([(u, v) for u, v in G.edges()] + [(v, u) for u, v in G.edges()])
+        expected = np.array(
+            [[float(v == w and x != u) for (w, x) in edges] for (u, v) in edges]
+        )
+        np.testing.assert_array_equal(B, expected)
+
+
 class TestNonbacktrackingCycleGraphs:
     """
     Tests for non-backtracking matrix eigenvalues on cycle graphs.
@@ -475,3 +491,29 @@ def test_eccentricity_complete_graph_is_adjacency():
     from db.matrices import eccentricity_matrix, adjacency_matrix
     G = nx.complete_graph(5)
     assert np.array_equal(eccentricity_matrix(G), adjacency_matrix(G))
+
+
+def test_nonbacktracking_laplacian_reuses_given_B():
+    """Passing a prebuilt Hashimoto matrix gives the same NBL as building it."""
+    from db.matrices import nonbacktracking_laplacian, nonbacktracking_matrix
+    for G in [nx.petersen_graph(), nx.path_graph(4), nx.empty_graph(3)]:
+        B = nonbacktracking_matrix(G)
+        assert np.array_equal(nonbacktracking_laplacian(G, B), nonbacktracking_laplacian(G))
+
+
+def test_builders_reuse_given_adjacency_and_distance():
+    """Passing prebuilt A / Dist gives the same matrices as building them."""
+    from db.matrices import (
+        adjacency_matrix, distance_matrix, kirchhoff_laplacian, signless_laplacian,
+        laplacian_matrix, yoon2_matrix, yoon3_matrix, distance_laplacian,
+        distance_signless_laplacian, normalized_distance_laplacian, eccentricity_matrix,
+    )
+    for G in [nx.petersen_graph(), nx.path_graph(5), nx.star_graph(4)]:
+        A = adjacency_matrix(G)
+        for builder in (kirchhoff_laplacian, signless_laplacian, laplacian_matrix,
+                        yoon2_matrix, yoon3_matrix):
+            assert np.array_equal(builder(G, A), builder(G))
+        Dist = distance_matrix(G)
+        for builder in (distance_laplacian, distance_signless_laplacian,
+                        normalized_distance_laplacian, eccentricity_matrix):
+            assert np.array_equal(builder(G, Dist), builder(G))
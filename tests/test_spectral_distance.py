@@ -0,0 +1,114 @@
+"""Tests for spectral distances."""
+
+import networkx as nx
+import numpy as np
+import ot
+import pytest
+from scipy.stats import wasserstein_distance
+
+from db.matrices import adjacency_matrix, nonbacktracking_matrix
+from db.spectral_distance import (
+    pairwise_wasserstein_sorted,
+    wasserstein_points,
+    wasserstein_sorted,
+)
+from db.spectrum import compute_complex_eigenvalues, compute_real_eigenvalues
+
+
+class TestWassersteinSorted:
+    """The sorted-array closed form must match scipy's general routine."""
+
+    def test_identical_spectra_zero(self):
+        eigs = compute_real_eigenvalues(adjacency_matrix(nx.cycle_graph(6)))
+        assert wasserstein_sorted(eigs, eigs) == 0.0
+
+    def test_matches_scipy_on_graph_spectra(self):
+        pairs = [
+            (nx.path_graph(5), nx.star_graph(4)),
+            (nx.cycle_graph(6), nx.complete_bipartite_graph(3, 3)),
+            (nx.complete_graph(4), nx.path_graph(4)),
+        ]
+        for G1, G2 in pairs:
+            a = compute_real_eigenvalues(adjacency_matrix(G1))
+            b = compute_real_eigenvalues(adjacency_matrix(G2))
+            assert wasserstein_sorted(a, b) == pytest.approx(wasserstein_distance(a, b))
+
+    def test_matches_scipy_random(self):
+        rng = np.random.default_rng(0)
+        for _ in range(20):
+            a = np.sort(rng.normal(size=9))
+            b = np.sort(rng.normal(size=9))
+            assert wasserstein_sorted(a, b) == pytest.approx(wasserstein_distance(a, b))
+
+    def test_accepts_lists(self):
+        assert wasserstein_sorted([0.0, 1.0], [1.0, 2.0]) == pytest.approx(1.0)
+
+    def test_empty(self):
+        assert wasserstein_sorted([], []) == 0.0
+
+    def test_length_mismatch_raises(self):
+        with pytest.raises(ValueError):
+            wasserstein_sorted([0.0, 1.0], [0.0])
+
+
+class TestWassersteinPoints:
+    """The assignment solution must match POT's exact EMD."""
+
+    def test_identical_spectra_zero(self):
+        eigs = compute_complex_eigenvalues(nonbacktracking_matrix(nx.complete_graph(4)))
+        p = np.column_stack([eigs.real, eigs.imag])
+        assert wasserstein_points(p, p) == pytest.approx(0.0)
+
+    def test_matches_emd_on_nb_spectra(self):
+        pairs = [
+            (nx.cycle_graph(5), nx.path_graph(6)),
+            (nx.complete_graph(4), nx.wheel_graph(4)),
+            (nx.cycle_graph(6), nx.complete_bipartite_graph(2, 3)),
+        ]
+        for G1, G2 in pairs:
+            e1 = compute_complex_eigenvalues(nonbacktracking_matrix(G1))
+            e2 = compute_complex_eigenvalues(nonbacktracking_matrix(G2))
+            if len(e1) != len(e2):
+                continue
+            p1 = np.column_stack([e1.real, e1.imag])
+            p2 = np.column_stack([e2.real, e2.imag])
+            w = np.ones(len(p1)) / len(p1)
+            expected = ot.emd2(w, w, ot.dist(p1, p2, metric="euclidean"))
+            assert wasserstein_points(p1, p2) == pytest.approx(expected)
+
+    def test_matches_emd_random(self):
+        rng = np.random.default_rng(1)
+        for _ in range(20):
+            p1 = rng.normal(size=(8, 2))
+            p2 = rng.normal(size=(8, 2))
+            w = np.ones(8) / 8
+            expected = ot.emd2(w, w, ot.dist(p1, p2, metric="euclidean"))
+            assert wasserstein_points(p1, p2) == pytest.approx(expected)
+
+    def test_empty(self):
+        assert wasserstein_points(np.empty((0, 2)), np.empty((0, 2))) == 0.0
+
+    def test_length_mismatch_raises(self):
+        with pytest.raises(ValueError):
+            wasserstein_points(np.zeros((2, 2)), np.zeros((3, 2)))
+
+
+class TestPairwiseWassersteinSorted:
+    def test_matches_pairwise_calls(self):
+        graphs = [nx.path_graph(5), nx.star_graph(4), nx.cycle_graph(5), nx.complete_graph(5)]
+        spectra = [compute_real_eigenvalues(adjacency_matrix(G)) for G in graphs]
+        D = pairwise_wasserstein_sorted(spectra)
+        assert D.shape == (4, 4)
+        for i in range(4):
+            assert D[i, i] == 0.0
+            for j in range(4):
+                if i != j:
+                    assert D[i, j] == pytest.approx(wasserstein_sorted(spectra[i], spectra[j]))
+
+    def test_missing_and_mismatched_are_nan(self):
+        spectra = [[0.0, 1.0], None, [0.0, 1.0, 2.0], [1.0, 2.0]]
+        D = pairwise_wasserstein_sorted(spectra)
+        assert D[0, 3] == pytest.approx(1.0)
+        assert np.isnan(D[0, 1]) and np.isnan(D[1, 3])
+        assert np.isnan(D[0, 2]) and np.isnan(D[2, 3])
+        assert np.all(np.diag(D) == 0.0)
@@ -381,3 +381,16 @@ def test_kblock_family_separates_blocking_distinguishable_pair():
     """K5 and the 5-cycle have different families and must hash differently."""
     from db.spectrum import kblock_family_signature
     assert kblock_family_signature(nx.complete_graph(5)) != kblock_family_signature(nx.cycle_graph(5))
+
+
+def test_nb_charpoly_matches_ihara_determinant():
+    """nb_charpoly's coefficients evaluate to det(I - zA + z^2(D - I))."""
+    from db.spectrum import nb_charpoly
+    for G in [nx.petersen_graph(), nx.path_graph(4), nx.complete_bipartite_graph(2, 3)]:
+        A = nx.to_numpy_array(G, dtype=int)
+        coeffs = nb_charpoly(A)
+        D = np.diag(A.sum(axis=1))
+        for z in (0.3, -0.7, 1.1):
+            M = np.eye(len(A)) - z * A + z * z * (D - np.eye(len(A)))
+            value = sum(c * z ** k for k, c in enumerate(coeffs))
+            assert np.isclose(value, np.linalg.det(M))
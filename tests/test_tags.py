@@ -477,3 +477,17 @@ class TestVertexTransitiveTag:
         G = nx.path_graph(5)
         tags = compute_tags(G)
         assert "vertex-transitive" not in tags
+
+    def test_cube_is_vertex_transitive(self):
+        """The 3-cube is vertex-transitive (found via automorphism search)."""
+        G = nx.cubical_graph()
+        tags = compute_tags(G)
+        assert "vertex-transitive" in tags
+
+    def test_regular_not_vertex_transitive(self):
+        """A cubic graph on 8 vertices with two triangles is not vertex-transitive."""
+        G = nx.Graph([(0, 1), (0, 3), (0, 4), (1, 4), (1, 7), (2, 3),
+                      (2, 5), (2, 6), (3, 7), (4, 6), (5, 6), (5, 7)])
+        tags = compute_tags(G)
+        assert "regular" in tags
+        assert "vertex-transitive" not in tags